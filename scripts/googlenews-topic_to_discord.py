@@ -1,4 +1,3 @@
-import xml.etree.ElementTree as ET
 import requests
 import re
 import os
@@ -6,126 +5,257 @@ import time
 import logging
 import json
 import base64
+import html
 import sqlite3
 import sys
-import pytz
+import atexit
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode, unquote, quote
 from email.utils import parsedate_to_datetime
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dateutil import parser
-from bs4 import BeautifulSoup
+from dateutil.relativedelta import relativedelta
+from bs4 import BeautifulSoup, SoupStrainer
+from io import BytesIO
+from collections import namedtuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
 
+try:
+    # libxml2 기반 파서를 우선 사용하고, 설치되지 않은 경우 표준 라이브러리로 대체합니다
+    from lxml import etree as ET
+    BS4_FEATURES = 'lxml'
+    # 큰 피드와 일부가 깨진 피드도 끝까지 파싱 (lxml 전용 옵션)
+    ITERPARSE_OPTIONS = {'huge_tree': True, 'recover': True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+    BS4_FEATURES = 'html.parser'
+    ITERPARSE_OPTIONS = {}
+
+try:
+    # 설명 HTML 파싱에 selectolax(lexbor)를 우선 사용하고, 설치되지 않은 경우 BeautifulSoup으로 대체합니다
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # JSON 직렬화에 orjson을 우선 사용하고, 설치되지 않은 경우 표준 json 모듈로 대체합니다
+    import orjson
+except ImportError:
+    orjson = None
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # 환경 변수에서 필요한 정보를 가져옵니다.
-DISCORD_WEBHOOK_TOPIC = os.environ.get('DISCORD_WEBHOOK_TOPIC')
-DISCORD_AVATAR_TOPIC = os.environ.get('DISCORD_AVATAR_TOPIC', '').strip()
-DISCORD_USERNAME_TOPIC = os.environ.get('DISCORD_USERNAME_TOPIC', '').strip()
-INITIALIZE_TOPIC = os.environ.get('INITIALIZE_MODE_TOPIC', 'false').lower() == 'true'
-ADVANCED_FILTER_TOPIC = os.environ.get('ADVANCED_FILTER_TOPIC', '')
-DATE_FILTER_TOPIC = os.environ.get('DATE_FILTER_TOPIC', '')
-ORIGIN_LINK_TOPIC = os.getenv('ORIGIN_LINK_TOPIC', '').lower()
-ORIGIN_LINK_TOPIC = ORIGIN_LINK_TOPIC not in ['false', 'f', '0', 'no', 'n']
-TOPIC_MODE = os.environ.get('TOPIC_MODE', 'false').lower() == 'true'
-TOPIC_KEYWORD = os.environ.get('TOPIC_KEYWORD', '')
-TOPIC_PARAMS = os.environ.get('TOPIC_PARAMS', '?hl=ko&gl=KR&ceid=KR%3Ako')
-RSS_URL_TOPIC = os.environ.get('RSS_URL_TOPIC', '')
+FALSE_VALUES = frozenset({'false', 'f', '0', 'no', 'n'})
+
+# (환경 변수 이름, 기본값)
+ENV_DEFAULTS = (
+    ('DISCORD_WEBHOOK_TOPIC', None),
+    ('DISCORD_AVATAR_TOPIC', ''),
+    ('DISCORD_USERNAME_TOPIC', ''),
+    ('INITIALIZE_MODE_TOPIC', 'false'),
+    ('ADVANCED_FILTER_TOPIC', ''),
+    ('DATE_FILTER_TOPIC', ''),
+    ('ORIGIN_LINK_TOPIC', ''),
+    ('TOPIC_MODE', 'false'),
+    ('TOPIC_KEYWORD', ''),
+    ('TOPIC_PARAMS', '?hl=ko&gl=KR&ceid=KR%3Ako'),
+    ('RSS_URL_TOPIC', ''),
+)
+ENV = {name: os.environ.get(name, default) for name, default in ENV_DEFAULTS}
+
+DISCORD_WEBHOOK_TOPIC = ENV['DISCORD_WEBHOOK_TOPIC']
+DISCORD_AVATAR_TOPIC = ENV['DISCORD_AVATAR_TOPIC'].strip()
+DISCORD_USERNAME_TOPIC = ENV['DISCORD_USERNAME_TOPIC'].strip()
+INITIALIZE_TOPIC = ENV['INITIALIZE_MODE_TOPIC'].lower() == 'true'
+ADVANCED_FILTER_TOPIC = ENV['ADVANCED_FILTER_TOPIC']
+DATE_FILTER_TOPIC = ENV['DATE_FILTER_TOPIC']
+ORIGIN_LINK_TOPIC = ENV['ORIGIN_LINK_TOPIC'].lower() not in FALSE_VALUES
+TOPIC_MODE = ENV['TOPIC_MODE'].lower() == 'true'
+TOPIC_KEYWORD = sys.intern(ENV['TOPIC_KEYWORD'])  # TOPIC_MAP 등 키워드 색인 조회용
+TOPIC_PARAMS = ENV['TOPIC_PARAMS']
+RSS_URL_TOPIC = ENV['RSS_URL_TOPIC']
 
 # DB 설정
 DB_PATH = 'google_news_topic.db'
-
-country_configs = {
+DB_CONNECTION = None  # get_db_connection()에서 생성하는 공유 연결
+
+# HTTP 세션 설정: news.google.com, discord.com 연결을 재사용합니다
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+atexit.register(SESSION.close)
+
+# 원본 링크를 동시에 확인할 최대 작업자 수
+ORIGIN_LINK_WORKERS = 10
+
+# parse_rss_feed에서 각 <item>으로부터 추출하는 필드
+RSS_ITEM_FIELDS = ('guid', 'title', 'link', 'pubDate', 'description')
+
+# BeautifulSoup 대체 파싱 시 <li> 하위 트리만 객체로 생성
+LIST_ITEM_STRAINER = SoupStrainer('li')
+
+# 관련 뉴스를 개별 열로 저장하는 최대 개수 (전체 목록은 related_news JSON에 저장)
+MAX_RELATED_NEWS = 10
+RELATED_NEWS_COLUMNS = tuple(
+    f"related_{field}_{i}" for i in range(1, MAX_RELATED_NEWS + 1) for field in ('title', 'press', 'link')
+)
+NEWS_ITEM_COLUMNS = ('pub_date', 'guid', 'title', 'link', 'topic', 'related_news') + RELATED_NEWS_COLUMNS
+INSERT_NEWS_ITEM_SQL = (
+    f"INSERT OR REPLACE INTO news_items ({', '.join(NEWS_ITEM_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(NEWS_ITEM_COLUMNS))})"
+)
+
+# 정규 표현식 (모듈 로드 시 한 번만 컴파일)
+GL_PARAM_PATTERN = re.compile(r'gl=(\w+)', re.ASCII)
+# 디코딩된 기사 ID는 bytes 그대로 검색 (URL은 공백을 제외한 출력 가능한 ASCII 문자로만 구성)
+YOUTUBE_ID_PATTERN = re.compile(rb'\x08 "\x0b([\w-]{11})\x98\x01\x01')
+URL_PATTERN = re.compile(rb'https?://[\x21-\x7E]+')
+# clean_url이 바꿀 것이 없는 URL (호스트로 시작하고 이스케이프, 백슬래시, %, 인코딩 대상 문자가 없는 http(s) URL)
+CLEAN_URL_FAST_PATTERN = re.compile(r'https?://[A-Za-z0-9_.~:@&=+$,-][A-Za-z0-9_.~/:@&=+$,?#-]*', re.ASCII)
+# Google 뉴스 설명의 정형화된 <li> 두 가지 (기사 링크 + 언론사, 전체 콘텐츠 보기 링크)
+DESCRIPTION_ITEM_PATTERN = re.compile(
+    r'<li><a href="([^"]*)"[^>]*>([^<]*)</a>([^<]*)<font color="#6f6f6f">([^<]*)</font></li>'
+    r'|<li><strong><a href="([^"]*)"[^>]*>([^<]*)</a></strong></li>'
+)
+UNICODE_ESCAPE_PATTERN = re.compile(r'\\u([0-9a-fA-F]{4})')
+BRACKET_TRANSLATION = str.maketrans({'[': '［', ']': '］', '<': '〈', '>': '〉'})
+# 여는 괄호 앞(문자열 시작 제외)과 닫는 괄호 뒤에 공백이 없으면 공백 하나를 넣을 위치
+BRACKET_SPACING_PATTERN = re.compile(r'(?<=[］〉])(?!\s)|(?<=\S)(?=[［〈])')
+FILTER_TERM_PATTERN = re.compile(r'([+-]?)(?:"([^"]*)"|\S+)')
+SINCE_FILTER_PATTERN = re.compile(r'since:(\d{4}-\d{2}-\d{2})', re.ASCII)
+UNTIL_FILTER_PATTERN = re.compile(r'until:(\d{4}-\d{2}-\d{2})', re.ASCII)
+PAST_FILTER_PATTERN = re.compile(r'past:(\d+)([hdmy])', re.ASCII)
+
+# 국가별 설정: (국가 코드, 언어, ceid, 브랜드명, 현지 국가명, 영문 국가명, 국기, 시간대, 날짜 형식)
+COUNTRY_ROWS = (
     # 동아시아
-    'KR': ('ko', 'KR:ko', 'Google 뉴스', '한국', 'South Korea', '🇰🇷', 'Asia/Seoul', '%Y년 %m월 %d일 %H:%M:%S (KST)'),
-    'JP': ('ja', 'JP:ja', 'Google ニュース', '日本', 'Japan', '🇯🇵', 'Asia/Tokyo', '%Y年%m月%d日 %H:%M:%S (JST)'),
-    'CN': ('zh-CN', 'CN:zh-Hans', 'Google 新闻', '中国', 'China', '🇨🇳', 'Asia/Shanghai', '%Y年%m月%d日 %H:%M:%S (CST)'),
-    'TW': ('zh-TW', 'TW:zh-Hant', 'Google 新聞', '台灣', 'Taiwan', '🇹🇼', 'Asia/Taipei', '%Y年%m月%d日 %H:%M:%S (NST)'),
-    'HK': ('zh-HK', 'HK:zh-Hant', 'Google 新聞', '香港', 'Hong Kong', '🇭🇰', 'Asia/Hong_Kong', '%Y年%m月%d日 %H:%M:%S (HKT)'),
+    ('KR', 'ko', 'KR:ko', 'Google 뉴스', '한국', 'South Korea', '🇰🇷', 'Asia/Seoul', '%Y년 %m월 %d일 %H:%M:%S (KST)'),
+    ('JP', 'ja', 'JP:ja', 'Google ニュース', '日本', 'Japan', '🇯🇵', 'Asia/Tokyo', '%Y年%m月%d日 %H:%M:%S (JST)'),
+    ('CN', 'zh-CN', 'CN:zh-Hans', 'Google 新闻', '中国', 'China', '🇨🇳', 'Asia/Shanghai', '%Y年%m月%d日 %H:%M:%S (CST)'),
+    ('TW', 'zh-TW', 'TW:zh-Hant', 'Google 新聞', '台灣', 'Taiwan', '🇹🇼', 'Asia/Taipei', '%Y年%m月%d日 %H:%M:%S (NST)'),
+    ('HK', 'zh-HK', 'HK:zh-Hant', 'Google 新聞', '香港', 'Hong Kong', '🇭🇰', 'Asia/Hong_Kong', '%Y年%m月%d日 %H:%M:%S (HKT)'),
     
     # 동남아시아
-    'VN': ('vi', 'VN:vi', 'Google Tin tức', 'Việt Nam', 'Vietnam', '🇻🇳', 'Asia/Ho_Chi_Minh', '%d/%m/%Y %H:%M:%S (ICT)'),
-    'TH': ('th', 'TH:th', 'Google News', 'ประเทศไทย', 'Thailand', '🇹🇭', 'Asia/Bangkok', '%d/%m/%Y %H:%M:%S (ICT)'),
-    'PH': ('en-PH', 'PH:en', 'Google News', 'Philippines', 'Philippines', '🇵🇭', 'Asia/Manila', '%Y-%m-%d %I:%M:%S %p (PHT)'),
-    'MY': ('ms-MY', 'MY:ms', 'Berita Google', 'Malaysia', 'Malaysia', '🇲🇾', 'Asia/Kuala_Lumpur', '%d/%m/%Y %H:%M:%S (MYT)'),
-    'SG': ('en-SG', 'SG:en', 'Google News', 'Singapore', 'Singapore', '🇸🇬', 'Asia/Singapore', '%Y-%m-%d %I:%M:%S %p (SGT)'),
-    'ID': ('id', 'ID:id', 'Google Berita', 'Indonesia', 'Indonesia', '🇮🇩', 'Asia/Jakarta', '%d/%m/%Y %H:%M:%S (WIB)'),
+    ('VN', 'vi', 'VN:vi', 'Google Tin tức', 'Việt Nam', 'Vietnam', '🇻🇳', 'Asia/Ho_Chi_Minh', '%d/%m/%Y %H:%M:%S (ICT)'),
+    ('TH', 'th', 'TH:th', 'Google News', 'ประเทศไทย', 'Thailand', '🇹🇭', 'Asia/Bangkok', '%d/%m/%Y %H:%M:%S (ICT)'),
+    ('PH', 'en-PH', 'PH:en', 'Google News', 'Philippines', 'Philippines', '🇵🇭', 'Asia/Manila', '%Y-%m-%d %I:%M:%S %p (PHT)'),
+    ('MY', 'ms-MY', 'MY:ms', 'Berita Google', 'Malaysia', 'Malaysia', '🇲🇾', 'Asia/Kuala_Lumpur', '%d/%m/%Y %H:%M:%S (MYT)'),
+    ('SG', 'en-SG', 'SG:en', 'Google News', 'Singapore', 'Singapore', '🇸🇬', 'Asia/Singapore', '%Y-%m-%d %I:%M:%S %p (SGT)'),
+    ('ID', 'id', 'ID:id', 'Google Berita', 'Indonesia', 'Indonesia', '🇮🇩', 'Asia/Jakarta', '%d/%m/%Y %H:%M:%S (WIB)'),
     
     # 남아시아
-    'IN': ('en-IN', 'IN:en', 'Google News', 'India', 'India', '🇮🇳', 'Asia/Kolkata', '%d/%m/%Y %I:%M:%S %p (IST)'),
-    'BD': ('bn', 'BD:bn', 'Google News', 'বাংলাদেশ', 'Bangladesh', '🇧🇩', 'Asia/Dhaka', '%d/%m/%Y %H:%M:%S (BST)'),
-    'PK': ('en-PK', 'PK:en', 'Google News', 'Pakistan', 'Pakistan', '🇵🇰', 'Asia/Karachi', '%d/%m/%Y %I:%M:%S %p (PKT)'),
+    ('IN', 'en-IN', 'IN:en', 'Google News', 'India', 'India', '🇮🇳', 'Asia/Kolkata', '%d/%m/%Y %I:%M:%S %p (IST)'),
+    ('BD', 'bn', 'BD:bn', 'Google News', 'বাংলাদেশ', 'Bangladesh', '🇧🇩', 'Asia/Dhaka', '%d/%m/%Y %H:%M:%S (BST)'),
+    ('PK', 'en-PK', 'PK:en', 'Google News', 'Pakistan', 'Pakistan', '🇵🇰', 'Asia/Karachi', '%d/%m/%Y %I:%M:%S %p (PKT)'),
     
     # 서아시아
-    'IL': ('he', 'IL:he', 'חדשות Google', 'ישראל', 'Israel', '🇮🇱', 'Asia/Jerusalem', '%d/%m/%Y %H:%M:%S (IST)'),
-    'AE': ('ar', 'AE:ar', 'أخبار Google', 'الإمارات العربية المتحدة', 'United Arab Emirates', '🇦🇪', 'Asia/Dubai', '%d/%m/%Y %I:%M:%S %p (GST)'),
-    'TR': ('tr', 'TR:tr', 'Google Haberler', 'Türkiye', 'Turkey', '🇹🇷', 'Europe/Istanbul', '%d.%m.%Y %H:%M:%S (TRT)'),
-    'LB': ('ar', 'LB:ar', 'أخبار Google', 'لبنان', 'Lebanon', '🇱🇧', 'Asia/Beirut', '%d/%m/%Y %I:%M:%S %p (EET)'),
+    ('IL', 'he', 'IL:he', 'חדשות Google', 'ישראל', 'Israel', '🇮🇱', 'Asia/Jerusalem', '%d/%m/%Y %H:%M:%S (IST)'),
+    ('AE', 'ar', 'AE:ar', 'أخبار Google', 'الإمارات العربية المتحدة', 'United Arab Emirates', '🇦🇪', 'Asia/Dubai', '%d/%m/%Y %I:%M:%S %p (GST)'),
+    ('TR', 'tr', 'TR:tr', 'Google Haberler', 'Türkiye', 'Turkey', '🇹🇷', 'Europe/Istanbul', '%d.%m.%Y %H:%M:%S (TRT)'),
+    ('LB', 'ar', 'LB:ar', 'أخبار Google', 'لبنان', 'Lebanon', '🇱🇧', 'Asia/Beirut', '%d/%m/%Y %I:%M:%S %p (EET)'),
 
     # 오세아니아
-    'AU': ('en-AU', 'AU:en', 'Google News', 'Australia', 'Australia', '🇦🇺', 'Australia/Sydney', '%d/%m/%Y %I:%M:%S %p (AEST)'),
-    'NZ': ('en-NZ', 'NZ:en', 'Google News', 'New Zealand', 'New Zealand', '🇳🇿', 'Pacific/Auckland', '%d/%m/%Y %I:%M:%S %p (NZST)'),
+    ('AU', 'en-AU', 'AU:en', 'Google News', 'Australia', 'Australia', '🇦🇺', 'Australia/Sydney', '%d/%m/%Y %I:%M:%S %p (AEST)'),
+    ('NZ', 'en-NZ', 'NZ:en', 'Google News', 'New Zealand', 'New Zealand', '🇳🇿', 'Pacific/Auckland', '%d/%m/%Y %I:%M:%S %p (NZST)'),
 
     # 러시아와 동유럽
-    'RU': ('ru', 'RU:ru', 'Google Новости', 'Россия', 'Russia', '🇷🇺', 'Europe/Moscow', '%d.%m.%Y %H:%M:%S (MSK)'),
-    'UA': ('uk', 'UA:uk', 'Google Новини', 'Україна', 'Ukraine', '🇺🇦', 'Europe/Kiev', '%d.%m.%Y %H:%M:%S (EET)'),
+    ('RU', 'ru', 'RU:ru', 'Google Новости', 'Россия', 'Russia', '🇷🇺', 'Europe/Moscow', '%d.%m.%Y %H:%M:%S (MSK)'),
+    ('UA', 'uk', 'UA:uk', 'Google Новини', 'Україна', 'Ukraine', '🇺🇦', 'Europe/Kyiv', '%d.%m.%Y %H:%M:%S (EET)'),
 
     # 유럽
-    'GR': ('el', 'GR:el', 'Ειδήσεις Google', 'Ελλάδα', 'Greece', '🇬🇷', 'Europe/Athens', '%d/%m/%Y %H:%M:%S (EET)'),
-    'DE': ('de', 'DE:de', 'Google News', 'Deutschland', 'Germany', '🇩🇪', 'Europe/Berlin', '%d.%m.%Y %H:%M:%S (CET)'),
-    'NL': ('nl', 'NL:nl', 'Google Nieuws', 'Nederland', 'Netherlands', '🇳🇱', 'Europe/Amsterdam', '%d-%m-%Y %H:%M:%S (CET)'),
-    'NO': ('no', 'NO:no', 'Google Nyheter', 'Norge', 'Norway', '🇳🇴', 'Europe/Oslo', '%d.%m.%Y %H:%M:%S (CET)'),
-    'LV': ('lv', 'LV:lv', 'Google ziņas', 'Latvija', 'Latvia', '🇱🇻', 'Europe/Riga', '%d.%m.%Y %H:%M:%S (EET)'),
-    'LT': ('lt', 'LT:lt', 'Google naujienos', 'Lietuva', 'Lithuania', '🇱🇹', 'Europe/Vilnius', '%Y-%m-%d %H:%M:%S (EET)'),
-    'RO': ('ro', 'RO:ro', 'Știri Google', 'România', 'Romania', '🇷🇴', 'Europe/Bucharest', '%d.%m.%Y %H:%M:%S (EET)'),
-    'BE': ('fr', 'BE:fr', 'Google Actualités', 'Belgique', 'Belgium', '🇧🇪', 'Europe/Brussels', '%d/%m/%Y %H:%M:%S (CET)'),
-    'BG': ('bg', 'BG:bg', 'Google Новини', 'България', 'Bulgaria', '🇧🇬', 'Europe/Sofia', '%d.%m.%Y %H:%M:%S (EET)'),
-    'SK': ('sk', 'SK:sk', 'Správy Google', 'Slovensko', 'Slovakia', '🇸🇰', 'Europe/Bratislava', '%d.%m.%Y %H:%M:%S (CET)'),
-    'SI': ('sl', 'SI:sl', 'Google News', 'Slovenija', 'Slovenia', '🇸🇮', 'Europe/Ljubljana', '%d.%m.%Y %H:%M:%S (CET)'),
-    'CH': ('de', 'CH:de', 'Google News', 'Schweiz', 'Switzerland', '🇨🇭', 'Europe/Zurich', '%d.%m.%Y %H:%M:%S (CET)'),
-    'ES': ('es', 'ES:es', 'Google News', 'España', 'Spain', '🇪🇸', 'Europe/Madrid', '%d/%m/%Y %H:%M:%S (CET)'),
-    'SE': ('sv', 'SE:sv', 'Google Nyheter', 'Sverige', 'Sweden', '🇸🇪', 'Europe/Stockholm', '%Y-%m-%d %H:%M:%S (CET)'),
-    'RS': ('sr', 'RS:sr', 'Google вести', 'Србија', 'Serbia', '🇷🇸', 'Europe/Belgrade', '%d.%m.%Y %H:%M:%S (CET)'),
-    'AT': ('de', 'AT:de', 'Google News', 'Österreich', 'Austria', '🇦🇹', 'Europe/Vienna', '%d.%m.%Y %H:%M:%S (CET)'),
-    'IE': ('en-IE', 'IE:en', 'Google News', 'Ireland', 'Ireland', '🇮🇪', 'Europe/Dublin', '%d/%m/%Y %H:%M:%S (GMT)'),
-    'EE': ('et-EE', 'EE:et', 'Google News', 'Eesti', 'Estonia', '🇪🇪', 'Europe/Tallinn', '%d.%m.%Y %H:%M:%S (EET)'),
-    'IT': ('it', 'IT:it', 'Google News', 'Italia', 'Italy', '🇮🇹', 'Europe/Rome', '%d/%m/%Y %H:%M:%S (CET)'),
-    'CZ': ('cs', 'CZ:cs', 'Zprávy Google', 'Česko', 'Czech Republic', '🇨🇿', 'Europe/Prague', '%d.%m.%Y %H:%M:%S (CET)'),
-    'GB': ('en-GB', 'GB:en', 'Google News', 'United Kingdom', 'United Kingdom', '🇬🇧', 'Europe/London', '%d/%m/%Y %H:%M:%S (GMT)'),
-    'PL': ('pl', 'PL:pl', 'Google News', 'Polska', 'Poland', '🇵🇱', 'Europe/Warsaw', '%d.%m.%Y %H:%M:%S (CET)'),
-    'PT': ('pt-PT', 'PT:pt-150', 'Google Notícias', 'Portugal', 'Portugal', '🇵🇹', 'Europe/Lisbon', '%d/%m/%Y %H:%M:%S (WET)'),
-    'FI': ('fi-FI', 'FI:fi', 'Google Uutiset', 'Suomi', 'Finland', '🇫🇮', 'Europe/Helsinki', '%d.%m.%Y %H:%M:%S (EET)'),
-    'FR': ('fr', 'FR:fr', 'Google Actualités', 'France', 'France', '🇫🇷', 'Europe/Paris', '%d/%m/%Y %H:%M:%S (CET)'),
-    'HU': ('hu', 'HU:hu', 'Google Hírek', 'Magyarország', 'Hungary', '🇭🇺', 'Europe/Budapest', '%Y.%m.%d %H:%M:%S (CET)'),
+    ('GR', 'el', 'GR:el', 'Ειδήσεις Google', 'Ελλάδα', 'Greece', '🇬🇷', 'Europe/Athens', '%d/%m/%Y %H:%M:%S (EET)'),
+    ('DE', 'de', 'DE:de', 'Google News', 'Deutschland', 'Germany', '🇩🇪', 'Europe/Berlin', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('NL', 'nl', 'NL:nl', 'Google Nieuws', 'Nederland', 'Netherlands', '🇳🇱', 'Europe/Amsterdam', '%d-%m-%Y %H:%M:%S (CET)'),
+    ('NO', 'no', 'NO:no', 'Google Nyheter', 'Norge', 'Norway', '🇳🇴', 'Europe/Oslo', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('LV', 'lv', 'LV:lv', 'Google ziņas', 'Latvija', 'Latvia', '🇱🇻', 'Europe/Riga', '%d.%m.%Y %H:%M:%S (EET)'),
+    ('LT', 'lt', 'LT:lt', 'Google naujienos', 'Lietuva', 'Lithuania', '🇱🇹', 'Europe/Vilnius', '%Y-%m-%d %H:%M:%S (EET)'),
+    ('RO', 'ro', 'RO:ro', 'Știri Google', 'România', 'Romania', '🇷🇴', 'Europe/Bucharest', '%d.%m.%Y %H:%M:%S (EET)'),
+    ('BE', 'fr', 'BE:fr', 'Google Actualités', 'Belgique', 'Belgium', '🇧🇪', 'Europe/Brussels', '%d/%m/%Y %H:%M:%S (CET)'),
+    ('BG', 'bg', 'BG:bg', 'Google Новини', 'България', 'Bulgaria', '🇧🇬', 'Europe/Sofia', '%d.%m.%Y %H:%M:%S (EET)'),
+    ('SK', 'sk', 'SK:sk', 'Správy Google', 'Slovensko', 'Slovakia', '🇸🇰', 'Europe/Bratislava', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('SI', 'sl', 'SI:sl', 'Google News', 'Slovenija', 'Slovenia', '🇸🇮', 'Europe/Ljubljana', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('CH', 'de', 'CH:de', 'Google News', 'Schweiz', 'Switzerland', '🇨🇭', 'Europe/Zurich', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('ES', 'es', 'ES:es', 'Google News', 'España', 'Spain', '🇪🇸', 'Europe/Madrid', '%d/%m/%Y %H:%M:%S (CET)'),
+    ('SE', 'sv', 'SE:sv', 'Google Nyheter', 'Sverige', 'Sweden', '🇸🇪', 'Europe/Stockholm', '%Y-%m-%d %H:%M:%S (CET)'),
+    ('RS', 'sr', 'RS:sr', 'Google вести', 'Србија', 'Serbia', '🇷🇸', 'Europe/Belgrade', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('AT', 'de', 'AT:de', 'Google News', 'Österreich', 'Austria', '🇦🇹', 'Europe/Vienna', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('IE', 'en-IE', 'IE:en', 'Google News', 'Ireland', 'Ireland', '🇮🇪', 'Europe/Dublin', '%d/%m/%Y %H:%M:%S (GMT)'),
+    ('EE', 'et-EE', 'EE:et', 'Google News', 'Eesti', 'Estonia', '🇪🇪', 'Europe/Tallinn', '%d.%m.%Y %H:%M:%S (EET)'),
+    ('IT', 'it', 'IT:it', 'Google News', 'Italia', 'Italy', '🇮🇹', 'Europe/Rome', '%d/%m/%Y %H:%M:%S (CET)'),
+    ('CZ', 'cs', 'CZ:cs', 'Zprávy Google', 'Česko', 'Czech Republic', '🇨🇿', 'Europe/Prague', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('GB', 'en-GB', 'GB:en', 'Google News', 'United Kingdom', 'United Kingdom', '🇬🇧', 'Europe/London', '%d/%m/%Y %H:%M:%S (GMT)'),
+    ('PL', 'pl', 'PL:pl', 'Google News', 'Polska', 'Poland', '🇵🇱', 'Europe/Warsaw', '%d.%m.%Y %H:%M:%S (CET)'),
+    ('PT', 'pt-PT', 'PT:pt-150', 'Google Notícias', 'Portugal', 'Portugal', '🇵🇹', 'Europe/Lisbon', '%d/%m/%Y %H:%M:%S (WET)'),
+    ('FI', 'fi-FI', 'FI:fi', 'Google Uutiset', 'Suomi', 'Finland', '🇫🇮', 'Europe/Helsinki', '%d.%m.%Y %H:%M:%S (EET)'),
+    ('FR', 'fr', 'FR:fr', 'Google Actualités', 'France', 'France', '🇫🇷', 'Europe/Paris', '%d/%m/%Y %H:%M:%S (CET)'),
+    ('HU', 'hu', 'HU:hu', 'Google Hírek', 'Magyarország', 'Hungary', '🇭🇺', 'Europe/Budapest', '%Y.%m.%d %H:%M:%S (CET)'),
 
     # 북미
-    'CA': ('en-CA', 'CA:en', 'Google News', 'Canada', 'Canada', '🇨🇦', 'America/Toronto', '%Y-%m-%d %I:%M:%S %p (EST)'),
-    'MX': ('es-419', 'MX:es-419', 'Google Noticias', 'México', 'Mexico', '🇲🇽', 'America/Mexico_City', '%d/%m/%Y %H:%M:%S (CST)'),
-    'US': ('en-US', 'US:en', 'Google News', 'United States', 'United States', '🇺🇸', 'America/New_York', '%Y-%m-%d %I:%M:%S %p (EST)'),
-    'CU': ('es-419', 'CU:es-419', 'Google Noticias', 'Cuba', 'Cuba', '🇨🇺', 'America/Havana', '%d/%m/%Y %H:%M:%S (CST)'),
+    ('CA', 'en-CA', 'CA:en', 'Google News', 'Canada', 'Canada', '🇨🇦', 'America/Toronto', '%Y-%m-%d %I:%M:%S %p (EST)'),
+    ('MX', 'es-419', 'MX:es-419', 'Google Noticias', 'México', 'Mexico', '🇲🇽', 'America/Mexico_City', '%d/%m/%Y %H:%M:%S (CST)'),
+    ('US', 'en-US', 'US:en', 'Google News', 'United States', 'United States', '🇺🇸', 'America/New_York', '%Y-%m-%d %I:%M:%S %p (EST)'),
+    ('CU', 'es-419', 'CU:es-419', 'Google Noticias', 'Cuba', 'Cuba', '🇨🇺', 'America/Havana', '%d/%m/%Y %H:%M:%S (CST)'),
 
     # 남미
-    'AR': ('es-419', 'AR:es-419', 'Google Noticias', 'Argentina', 'Argentina', '🇦🇷', 'America/Buenos_Aires', '%d/%m/%Y %H:%M:%S (ART)'),
-    'BR': ('pt-BR', 'BR:pt-419', 'Google Notícias', 'Brasil', 'Brazil', '🇧🇷', 'America/Sao_Paulo', '%d/%m/%Y %H:%M:%S (BRT)'),
-    'CL': ('es-419', 'CL:es-419', 'Google Noticias', 'Chile', 'Chile', '🇨🇱', 'America/Santiago', '%d-%m-%Y %H:%M:%S (CLT)'),
-    'CO': ('es-419', 'CO:es-419', 'Google Noticias', 'Colombia', 'Colombia', '🇨🇴', 'America/Bogota', '%d/%m/%Y %I:%M:%S %p (COT)'),
-    'PE': ('es-419', 'PE:es-419', 'Google Noticias', 'Perú', 'Peru', '🇵🇪', 'America/Lima', '%d/%m/%Y %I:%M:%S %p (PET)'),
-    'VE': ('es-419', 'VE:es-419', 'Google Noticias', 'Venezuela', 'Venezuela', '🇻🇪', 'America/Caracas', '%d/%m/%Y %I:%M:%S %p (VET)'),
+    ('AR', 'es-419', 'AR:es-419', 'Google Noticias', 'Argentina', 'Argentina', '🇦🇷', 'America/Argentina/Buenos_Aires', '%d/%m/%Y %H:%M:%S (ART)'),
+    ('BR', 'pt-BR', 'BR:pt-419', 'Google Notícias', 'Brasil', 'Brazil', '🇧🇷', 'America/Sao_Paulo', '%d/%m/%Y %H:%M:%S (BRT)'),
+    ('CL', 'es-419', 'CL:es-419', 'Google Noticias', 'Chile', 'Chile', '🇨🇱', 'America/Santiago', '%d-%m-%Y %H:%M:%S (CLT)'),
+    ('CO', 'es-419', 'CO:es-419', 'Google Noticias', 'Colombia', 'Colombia', '🇨🇴', 'America/Bogota', '%d/%m/%Y %I:%M:%S %p (COT)'),
+    ('PE', 'es-419', 'PE:es-419', 'Google Noticias', 'Perú', 'Peru', '🇵🇪', 'America/Lima', '%d/%m/%Y %I:%M:%S %p (PET)'),
+    ('VE', 'es-419', 'VE:es-419', 'Google Noticias', 'Venezuela', 'Venezuela', '🇻🇪', 'America/Caracas', '%d/%m/%Y %I:%M:%S %p (VET)'),
 
     # 아프리카
-    'ZA': ('en-ZA', 'ZA:en', 'Google News', 'South Africa', 'South Africa', '🇿🇦', 'Africa/Johannesburg', '%Y-%m-%d %H:%M:%S (SAST)'),
-    'NG': ('en-NG', 'NG:en', 'Google News', 'Nigeria', 'Nigeria', '🇳🇬', 'Africa/Lagos', '%d/%m/%Y %I:%M:%S %p (WAT)'),
-    'EG': ('ar', 'EG:ar', 'أخبار Google', 'مصر', 'Egypt', '🇪🇬', 'Africa/Cairo', '%d/%m/%Y %I:%M:%S %p (EET)'),
-    'KE': ('en-KE', 'KE:en', 'Google News', 'Kenya', 'Kenya', '🇰🇪', 'Africa/Nairobi', '%d/%m/%Y %I:%M:%S %p (EAT)'),
-    'MA': ('fr', 'MA:fr', 'Google Actualités', 'Maroc', 'Morocco', '🇲🇦', 'Africa/Casablanca', '%d/%m/%Y %H:%M:%S (WET)'),
-    'SN': ('fr', 'SN:fr', 'Google Actualités', 'Sénégal', 'Senegal', '🇸🇳', 'Africa/Dakar', '%d/%m/%Y %H:%M:%S (GMT)'),
-    'UG': ('en-UG', 'UG:en', 'Google News', 'Uganda', 'Uganda', '🇺🇬', 'Africa/Kampala', '%d/%m/%Y %I:%M:%S %p (EAT)'),
-    'TZ': ('en-TZ', 'TZ:en', 'Google News', 'Tanzania', 'Tanzania', '🇹🇿', 'Africa/Dar_es_Salaam', '%d/%m/%Y %I:%M:%S %p (EAT)'),
-    'ZW': ('en-ZW', 'ZW:en', 'Google News', 'Zimbabwe', 'Zimbabwe', '🇿🇼', 'Africa/Harare', '%d/%m/%Y %I:%M:%S %p (CAT)'),
-    'ET': ('en-ET', 'ET:en', 'Google News', 'Ethiopia', 'Ethiopia', '🇪🇹', 'Africa/Addis_Ababa', '%d/%m/%Y %I:%M:%S %p (EAT)'),
-    'GH': ('en-GH', 'GH:en', 'Google News', 'Ghana', 'Ghana', '🇬🇭', 'Africa/Accra', '%d/%m/%Y %I:%M:%S %p (GMT)'),
-}
+    ('ZA', 'en-ZA', 'ZA:en', 'Google News', 'South Africa', 'South Africa', '🇿🇦', 'Africa/Johannesburg', '%Y-%m-%d %H:%M:%S (SAST)'),
+    ('NG', 'en-NG', 'NG:en', 'Google News', 'Nigeria', 'Nigeria', '🇳🇬', 'Africa/Lagos', '%d/%m/%Y %I:%M:%S %p (WAT)'),
+    ('EG', 'ar', 'EG:ar', 'أخبار Google', 'مصر', 'Egypt', '🇪🇬', 'Africa/Cairo', '%d/%m/%Y %I:%M:%S %p (EET)'),
+    ('KE', 'en-KE', 'KE:en', 'Google News', 'Kenya', 'Kenya', '🇰🇪', 'Africa/Nairobi', '%d/%m/%Y %I:%M:%S %p (EAT)'),
+    ('MA', 'fr', 'MA:fr', 'Google Actualités', 'Maroc', 'Morocco', '🇲🇦', 'Africa/Casablanca', '%d/%m/%Y %H:%M:%S (WET)'),
+    ('SN', 'fr', 'SN:fr', 'Google Actualités', 'Sénégal', 'Senegal', '🇸🇳', 'Africa/Dakar', '%d/%m/%Y %H:%M:%S (GMT)'),
+    ('UG', 'en-UG', 'UG:en', 'Google News', 'Uganda', 'Uganda', '🇺🇬', 'Africa/Kampala', '%d/%m/%Y %I:%M:%S %p (EAT)'),
+    ('TZ', 'en-TZ', 'TZ:en', 'Google News', 'Tanzania', 'Tanzania', '🇹🇿', 'Africa/Dar_es_Salaam', '%d/%m/%Y %I:%M:%S %p (EAT)'),
+    ('ZW', 'en-ZW', 'ZW:en', 'Google News', 'Zimbabwe', 'Zimbabwe', '🇿🇼', 'Africa/Harare', '%d/%m/%Y %I:%M:%S %p (CAT)'),
+    ('ET', 'en-ET', 'ET:en', 'Google News', 'Ethiopia', 'Ethiopia', '🇪🇹', 'Africa/Addis_Ababa', '%d/%m/%Y %I:%M:%S %p (EAT)'),
+    ('GH', 'en-GH', 'GH:en', 'Google News', 'Ghana', 'Ghana', '🇬🇭', 'Africa/Accra', '%d/%m/%Y %I:%M:%S %p (GMT)'),
+)
+
+# 국가 코드 -> COUNTRY_ROWS 인덱스
+COUNTRY_INDEX = {row[0]: index for index, row in enumerate(COUNTRY_ROWS)}
+
+CountryConfig = namedtuple('CountryConfig', 'code lang ceid brand native_name english_name flag timezone date_format')
+
+@lru_cache(maxsize=None)
+def get_country_config(country_code):
+    """국가 코드에 해당하는 국가 설정을 반환합니다. 등록되지 않은 국가이면 None을 반환합니다.
+
+    같은 국가 코드에는 항상 같은 CountryConfig 객체를 공유합니다.
+    """
+    index = COUNTRY_INDEX.get(country_code)
+    if index is None:
+        return None
+    return CountryConfig._make(COUNTRY_ROWS[index])
+
+def load_country_timezone(timezone_name):
+    """시간대 객체를 생성합니다. 시간대 DB에 없는 시간대이면 경고를 남기고 None(UTC 표시)을 반환합니다."""
+    try:
+        return ZoneInfo(timezone_name)
+    except ZoneInfoNotFoundError:
+        logging.warning("시간대를 찾을 수 없어 UTC로 표시합니다: %s", timezone_name)
+        return None
+
+# 국가 코드 -> 시간대 객체 (기사마다 시간대 DB를 다시 읽지 않도록 미리 생성)
+COUNTRY_TIMEZONES = {row[0]: load_country_timezone(row[7]) for row in COUNTRY_ROWS}
+
+# 국가 코드 -> 플래그 이모지
+COUNTRY_FLAGS = {row[0]: row[6] for row in COUNTRY_ROWS}
 
 # 토픽 ID 매핑
 # - "headlines": 토픽키워드
@@ -641,6 +771,16 @@ TOPIC_MAP = {
     }
 }
 
+# (토픽 키워드, 언어) -> (이름, 토픽 ID), 토픽 ID -> (이름, 토픽 키워드) 색인
+TOPIC_INDEX = {
+    (keyword, lang): topic_info
+    for keyword, lang_data in TOPIC_MAP.items()
+    for lang, topic_info in lang_data.items()
+    if lang != 'mid'
+}
+# 같은 ID가 여러 번 나오면 TOPIC_MAP에서 먼저 나온 항목을 사용합니다
+TOPIC_ID_INDEX = {topic_info[1]: (topic_info[0], keyword) for (keyword, _), topic_info in reversed(TOPIC_INDEX.items())}
+
 TOPIC_CATEGORY = {
     'ko': "주제",
     'en': "Topics",
@@ -648,212 +788,220 @@ TOPIC_CATEGORY = {
     'zh': "主题"
 }
 
+# 카테고리별 언어별 이름과 해당 토픽 키워드
+TOPIC_CATEGORIES = {
+    "headlines": {
+        "en": "Headlines news",
+        "ko": "헤드라인 뉴스",
+        "zh": "头条新闻",
+        "ja": "ヘッドライン ニュース",
+        "de": "Schlagzeilen",
+        "fr": "Actualités à la une",
+        "es": "Titulares",
+        "pt": "Notícias principais",
+        "it": "Notizie in primo piano",
+        "nl": "Hoofdnieuws",
+        "sv": "Nyheter i fokus",
+        "ar": "عناوين الأخبار",
+        "ru": "Главные новости",
+        "keywords": ["headlines", "korea", "us", "japan", "china", "world", "politics"]
+    },
+    "entertainment": {
+        "en": "Entertainment news",
+        "ko": "연예 뉴스",
+        "zh": "娱乐新闻",
+        "ja": "芸能関連のニュース",
+        "de": "Nachrichten aus dem Bereich Unterhaltung",
+        "fr": "Actus divertissements",
+        "es": "Noticias sobre espectáculos",
+        "pt": "Notícias de entretenimento",
+        "it": "Notizie di intrattenimento",
+        "nl": "Entertainmentnieuws",
+        "sv": "Underhållningsnyheter",
+        "ar": "أخبار ترفيهية",
+        "ru": "Развлекательные новости",
+        "keywords": ["entertainment", "celebrity", "tv", "music", "movies", "theater"]
+    },
+    "sports": {
+        "en": "Sports news",
+        "ko": "스포츠 뉴스",
+        "zh": "体育新闻",
+        "ja": "スポーツ関連のニュース",
+        "de": "Nachrichten aus dem Bereich Sport",
+        "fr": "Actus sportives",
+        "es": "Noticias sobre deportes",
+        "pt": "Notícias de esportes",
+        "it": "Notizie sportive",
+        "nl": "Sportnieuws",
+        "sv": "Sportnyheter",
+        "ar": "الأخبار الرياضية",
+        "ru": "Спортивные новости",
+        "keywords": ["sports", "soccer", "cycling", "motorsports", "tennis", "martial_arts", 
+                     "basketball", "baseball", "american_football", "sports_betting", 
+                     "water_sports", "hockey", "golf", "cricket", "rugby"]
+    },
+    "business": {
+        "en": "Business news",
+        "ko": "비즈니스 뉴스",
+        "zh": "财经新闻",
+        "ja": "ビジネス関連のニュース",
+        "de": "Wirtschaftsmeldungen",
+        "fr": "Actus économiques",
+        "es": "Noticias de negocios",
+        "pt": "Notícias de negócios",
+        "it": "Notizie economiche",
+        "nl": "Zakennieuws",
+        "sv": "Ekonominyheter",
+        "ar": "أخبار الأعمال",
+        "ru": "Бизнес новости",
+        "keywords": ["business", "economy", "personal_finance", "finance", "digital_currency"]
+    },
+    "technology": {
+        "en": "Technology news",
+        "ko": "기술 뉴스",
+        "zh": "科技新闻",
+        "ja": "テクノロジー関連のニュース",
+        "de": "Nachrichten aus dem Bereich Technologie",
+        "fr": "Actus technologie",
+        "es": "Noticias de tecnología",
+        "pt": "Notícias de tecnologia",
+        "it": "Notizie di tecnologia",
+        "nl": "Technologienieuws",
+        "sv": "Teknologinyheter",
+        "ar": "أخبار التكنولوجيا",
+        "ru": "Технологические новости",
+        "keywords": ["technology", "science_technology", "mobile", "energy", "games", "internet_security", 
+                     "electronics", "virtual_reality", "robotics"]
+    },
+    "health": {
+        "en": "Health news",
+        "ko": "건강 뉴스",
+        "zh": "健康新闻",
+        "ja": "健康関連のニュース",
+        "de": "Nachrichten aus dem Bereich Gesundheit",
+        "fr": "Actus santé",
+        "es": "Noticias sobre salud",
+        "pt": "Notícias de saúde",
+        "it": "Notizie di salute",
+        "nl": "Gezondheidsnieuws",
+        "sv": "Hälsonews",
+        "ar": "أخبار الصحة",
+        "ru": "Новости здоровья",
+        "keywords": ["health", "nutrition", "public_health", "mental_health", "medicine"]
+    },
+    "science": {
+        "en": "Science news",
+        "ko": "과학 뉴스",
+        "zh": "科学新闻",
+        "ja": "科学関連のニュース",
+        "de": "Nachrichten aus dem Bereich Wissenschaft",
+        "fr": "Actus sciences",
+        "es": "Noticias de ciencia",
+        "pt": "Notícias de ciência",
+        "it": "Notizie di scienza",
+        "nl": "Wetenschapsnieuws",
+        "sv": "Vetenskapsnyheter",
+        "ar": "أخبار علمية",
+        "ru": "Научные новости",
+        "keywords": ["science", "space", "wildlife", "environment", "neuroscience", 
+                     "physics", "geography", "paleontology", "social_science"]
+    },
+    "education": {
+        "en": "Education news",
+        "ko": "교육 뉴스",
+        "zh": "教育新闻",
+        "ja": "教育関連のニュース",
+        "de": "Nachrichten aus dem Bereich Bildung",
+        "fr": "Actus enseignement",
+        "es": "Noticias sobre educación",
+        "pt": "Notícias de educação",
+        "it": "Notizie di istruzione",
+        "nl": "Onderwijsnieuws",
+        "sv": "Utbildningsnyheter",
+        "ar": "أخبار التعليم",
+        "ru": "Образовательные новости",
+        "keywords": ["education", "job_market", "online_education", "higher_education"]
+    },
+    "lifestyle": {
+        "en": "Lifestyle news",
+        "ko": "라이프스타일 뉴스",
+        "zh": "生活时尚新闻",
+        "ja": "ライフスタイル関連のニュース",
+        "de": "Nachrichten aus dem Bereich Lifestyle",
+        "fr": "Actus mode de vie",
+        "es": "Noticias de estilo de vida",
+        "pt": "Notícias de estilo de vida",
+        "it": "Notizie di lifestyle",
+        "nl": "Lifestyle nieuws",
+        "sv": "Livsstilsnyheter",
+        "ar": "أخبار أسلوب الحياة",
+        "ru": "Новости образа жизни",
+        "keywords": ["lifestyle", "automotive", "art_design", "beauty", "food", "travel", 
+                     "shopping", "home", "outdoor", "fashion"]
+    }
+}
+
+# 토픽 키워드 -> 카테고리 데이터 (여러 카테고리에 속하면 먼저 나온 카테고리 사용)
+KEYWORD_CATEGORY = {
+    keyword: category_data
+    for category_data in reversed(list(TOPIC_CATEGORIES.values()))
+    for keyword in category_data["keywords"]
+}
+
+# 언어별 Google 뉴스 서비스 이름
+NEWS_PREFIX_MAP = {
+    'bn': "Google সংবাদ",
+    'zh': "Google 新闻",
+    'en': "Google News",
+    'id': "Google Berita",
+    'iw': "Google חדשות",
+    'ja': "Google ニュース",
+    'ar': "Google أخبار",
+    'ms': "Google Berita",
+    'ko': "Google 뉴스",
+    'th': "Google ข่าว",
+    'tr': "Google Haberler",
+    'vi': "Google Tin tức",
+    'ru': "Google Новости",
+    'de': "Google Nachrichten",
+    'fr': "Google Actualités",
+    'es': "Google Noticias",
+    'it': "Google Notizie",
+    'nl': "Google Nieuws",
+    'no': "Google Nyheter",
+    'pl': "Google Wiadomości",
+    'ro': "Google Știri",
+    'hu': "Google Hírek",
+    'cs': "Google Zprávy",
+    'fi': "Google Uutiset",
+    'da': "Google Nyheder",
+    'el': "Google Ειδήσεις",
+    'sv': "Google Nyheter",
+    'pt': "Google Notícias",
+    # 추가 언어...
+}
+
 def get_news_prefix(lang):
     """언어에 따라 뉴스 접두어를 반환합니다."""
-    news_prefix_map = {
-        'bn': "Google সংবাদ",
-        'zh': "Google 新闻",
-        'en': "Google News",
-        'id': "Google Berita",
-        'iw': "Google חדשות",
-        'ja': "Google ニュース",
-        'ar': "Google أخبار",
-        'ms': "Google Berita",
-        'ko': "Google 뉴스",
-        'th': "Google ข่าว",
-        'tr': "Google Haberler",
-        'vi': "Google Tin tức",
-        'ru': "Google Новости",
-        'de': "Google Nachrichten",
-        'fr': "Google Actualités",
-        'es': "Google Noticias",
-        'it': "Google Notizie",
-        'nl': "Google Nieuws",
-        'no': "Google Nyheter",
-        'pl': "Google Wiadomości",
-        'ro': "Google Știri",
-        'hu': "Google Hírek",
-        'cs': "Google Zprávy",
-        'fi': "Google Uutiset",
-        'da': "Google Nyheder",
-        'el': "Google Ειδήσεις",
-        'sv': "Google Nyheter",
-        'pt': "Google Notícias",
-        # 추가 언어...
-    }
-    return news_prefix_map.get(lang, "Google News")
+    return NEWS_PREFIX_MAP.get(lang, "Google News")
 
 def get_topic_category(keyword, lang='en'):
     """토픽 키워드에 해당하는 카테고리를 반환합니다."""
-    categories = {
-        "headlines": {
-            "en": "Headlines news",
-            "ko": "헤드라인 뉴스",
-            "zh": "头条新闻",
-            "ja": "ヘッドライン ニュース",
-            "de": "Schlagzeilen",
-            "fr": "Actualités à la une",
-            "es": "Titulares",
-            "pt": "Notícias principais",
-            "it": "Notizie in primo piano",
-            "nl": "Hoofdnieuws",
-            "sv": "Nyheter i fokus",
-            "ar": "عناوين الأخبار",
-            "ru": "Главные новости",
-            "keywords": ["headlines", "korea", "us", "japan", "china", "world", "politics"]
-        },
-        "entertainment": {
-            "en": "Entertainment news",
-            "ko": "연예 뉴스",
-            "zh": "娱乐新闻",
-            "ja": "芸能関連のニュース",
-            "de": "Nachrichten aus dem Bereich Unterhaltung",
-            "fr": "Actus divertissements",
-            "es": "Noticias sobre espectáculos",
-            "pt": "Notícias de entretenimento",
-            "it": "Notizie di intrattenimento",
-            "nl": "Entertainmentnieuws",
-            "sv": "Underhållningsnyheter",
-            "ar": "أخبار ترفيهية",
-            "ru": "Развлекательные новости",
-            "keywords": ["entertainment", "celebrity", "tv", "music", "movies", "theater"]
-        },
-        "sports": {
-            "en": "Sports news",
-            "ko": "스포츠 뉴스",
-            "zh": "体育新闻",
-            "ja": "スポーツ関連のニュース",
-            "de": "Nachrichten aus dem Bereich Sport",
-            "fr": "Actus sportives",
-            "es": "Noticias sobre deportes",
-            "pt": "Notícias de esportes",
-            "it": "Notizie sportive",
-            "nl": "Sportnieuws",
-            "sv": "Sportnyheter",
-            "ar": "الأخبار الرياضية",
-            "ru": "Спортивные новости",
-            "keywords": ["sports", "soccer", "cycling", "motorsports", "tennis", "martial_arts", 
-                         "basketball", "baseball", "american_football", "sports_betting", 
-                         "water_sports", "hockey", "golf", "cricket", "rugby"]
-        },
-        "business": {
-            "en": "Business news",
-            "ko": "비즈니스 뉴스",
-            "zh": "财经新闻",
-            "ja": "ビジネス関連のニュース",
-            "de": "Wirtschaftsmeldungen",
-            "fr": "Actus économiques",
-            "es": "Noticias de negocios",
-            "pt": "Notícias de negócios",
-            "it": "Notizie economiche",
-            "nl": "Zakennieuws",
-            "sv": "Ekonominyheter",
-            "ar": "أخبار الأعمال",
-            "ru": "Бизнес новости",
-            "keywords": ["business", "economy", "personal_finance", "finance", "digital_currency"]
-        },
-        "technology": {
-            "en": "Technology news",
-            "ko": "기술 뉴스",
-            "zh": "科技新闻",
-            "ja": "テクノロジー関連のニュース",
-            "de": "Nachrichten aus dem Bereich Technologie",
-            "fr": "Actus technologie",
-            "es": "Noticias de tecnología",
-            "pt": "Notícias de tecnologia",
-            "it": "Notizie di tecnologia",
-            "nl": "Technologienieuws",
-            "sv": "Teknologinyheter",
-            "ar": "أخبار التكنولوجيا",
-            "ru": "Технологические новости",
-            "keywords": ["technology", "science_technology", "mobile", "energy", "games", "internet_security", 
-                         "electronics", "virtual_reality", "robotics"]
-        },
-        "health": {
-            "en": "Health news",
-            "ko": "건강 뉴스",
-            "zh": "健康新闻",
-            "ja": "健康関連のニュース",
-            "de": "Nachrichten aus dem Bereich Gesundheit",
-            "fr": "Actus santé",
-            "es": "Noticias sobre salud",
-            "pt": "Notícias de saúde",
-            "it": "Notizie di salute",
-            "nl": "Gezondheidsnieuws",
-            "sv": "Hälsonews",
-            "ar": "أخبار الصحة",
-            "ru": "Новости здоровья",
-            "keywords": ["health", "nutrition", "public_health", "mental_health", "medicine"]
-        },
-        "science": {
-            "en": "Science news",
-            "ko": "과학 뉴스",
-            "zh": "科学新闻",
-            "ja": "科学関連のニュース",
-            "de": "Nachrichten aus dem Bereich Wissenschaft",
-            "fr": "Actus sciences",
-            "es": "Noticias de ciencia",
-            "pt": "Notícias de ciência",
-            "it": "Notizie di scienza",
-            "nl": "Wetenschapsnieuws",
-            "sv": "Vetenskapsnyheter",
-            "ar": "أخبار علمية",
-            "ru": "Научные новости",
-            "keywords": ["science", "space", "wildlife", "environment", "neuroscience", 
-                         "physics", "geography", "paleontology", "social_science"]
-        },
-        "education": {
-            "en": "Education news",
-            "ko": "교육 뉴스",
-            "zh": "教育新闻",
-            "ja": "教育関連のニュース",
-            "de": "Nachrichten aus dem Bereich Bildung",
-            "fr": "Actus enseignement",
-            "es": "Noticias sobre educación",
-            "pt": "Notícias de educação",
-            "it": "Notizie di istruzione",
-            "nl": "Onderwijsnieuws",
-            "sv": "Utbildningsnyheter",
-            "ar": "أخبار التعليم",
-            "ru": "Образовательные новости",
-            "keywords": ["education", "job_market", "online_education", "higher_education"]
-        },
-        "lifestyle": {
-            "en": "Lifestyle news",
-            "ko": "라이프스타일 뉴스",
-            "zh": "生活时尚新闻",
-            "ja": "ライフスタイル関連のニュース",
-            "de": "Nachrichten aus dem Bereich Lifestyle",
-            "fr": "Actus mode de vie",
-            "es": "Noticias de estilo de vida",
-            "pt": "Notícias de estilo de vida",
-            "it": "Notizie di lifestyle",
-            "nl": "Lifestyle nieuws",
-            "sv": "Livsstilsnyheter",
-            "ar": "أخبار أسلوب الحياة",
-            "ru": "Новости образа жизни",
-            "keywords": ["lifestyle", "automotive", "art_design", "beauty", "food", "travel", 
-                         "shopping", "home", "outdoor", "fashion"]
-        }
-    }
-    
-    for category, data in categories.items():
-        if keyword in data["keywords"]:
-            return data[lang]
+    data = KEYWORD_CATEGORY.get(keyword)
+    if data:
+        return data[lang]
     
     return "기타 뉴스" if lang == 'ko' else "Other News"
 
 def get_topic_display_name(keyword, lang):
     """토픽 키워드에 해당하는 표시 이름을 반환합니다."""
-    topic_info = TOPIC_MAP.get(keyword, {}).get(lang)
-    if topic_info:
-        return topic_info[0]
-    else:
-        # 해당 언어가 없을 경우 en을 기본값으로 사용
-        return TOPIC_MAP.get(keyword, {}).get("en", (keyword, ''))[0]
+    return get_topic_info(keyword, lang)[0]
 
 def get_country_emoji(country_code):
     """국가 코드를 유니코드 플래그 이모지로 변환합니다."""
+    flag = COUNTRY_FLAGS.get(country_code)
+    if flag:
+        return flag
     if len(country_code) != 2:
         return ''
     return chr(ord(country_code[0].upper()) + 127397) + chr(ord(country_code[1].upper()) + 127397)
@@ -864,30 +1012,27 @@ def is_korean_params(params):
 
 def get_language_from_params(params):
     """URL 파라미터에서 언어 코드를 추출합니다."""
-    hl_match = re.search(r'hl=(\w+)', params)
-    if hl_match:
-        lang = hl_match.group(1).lower()
-        return "ko" if lang.startswith("ko") else "en"
-    return "en"  # 기본값
+    start = params.find('hl=')
+    if start < 0:
+        return "en"  # 기본값
+    end = params.find('&', start + 3)
+    lang = params[start + 3:end if end >= 0 else None].lower()
+    return "ko" if lang.startswith("ko") else "en"
 
 def get_topic_info(keyword, lang):
     """토픽 키워드와 언어에 해당하는 정보를 반환합니다."""
-    topic_info = TOPIC_MAP.get(keyword, {}).get(lang)
+    topic_info = TOPIC_INDEX.get((keyword, lang))
     if topic_info:
         return topic_info
     else:
         # 해당 언어가 없을 경우 en을 기본값으로 사용
-        return TOPIC_MAP.get(keyword, {}).get("en", (keyword, ''))
+        return TOPIC_INDEX.get((keyword, "en"), (keyword, ''))
 
 def get_topic_by_id(rss_url_topic):
     """RSS URL에서 토픽 ID를 추출하여 해당하는 토픽 이름과 카테고리를 반환합니다."""
     parsed_url = urlparse(rss_url_topic)
     topic_id = parsed_url.path.split('/')[-1]
-    for keyword, lang_data in TOPIC_MAP.items():
-        for lang, (name, id) in lang_data.items():
-            if id == topic_id:
-                return name, keyword
-    return None, None
+    return TOPIC_ID_INDEX.get(topic_id, (None, None))
 
 def check_env_variables():
     """환경 변수가 올바르게 설정되어 있는지 확인합니다."""
@@ -906,100 +1051,116 @@ def check_env_variables():
             raise ValueError("토픽 모드가 비활성화되었을 때는 RSS_URL_TOPIC을 설정해야 합니다.")
         logging.info(f"일반 모드 활성화, RSS 피드 URL: {RSS_URL_TOPIC}")
 
+def get_db_connection():
+    """실행 전체에서 공유하는 SQLite 연결을 반환합니다. 첫 호출 시 연결을 열고 PRAGMA를 설정합니다."""
+    global DB_CONNECTION
+    if DB_CONNECTION is None:
+        # 트랜잭션은 save_news_items에서 BEGIN으로 직접 관리합니다
+        DB_CONNECTION = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        DB_CONNECTION.execute("PRAGMA journal_mode=WAL")
+        DB_CONNECTION.execute("PRAGMA synchronous=NORMAL")
+        DB_CONNECTION.execute("PRAGMA temp_store=MEMORY")
+        DB_CONNECTION.execute("PRAGMA mmap_size=268435456")
+        DB_CONNECTION.execute("PRAGMA cache_size=-65536")
+        # 종료 시 연결을 닫아 WAL 내용을 DB 파일에 반영합니다
+        atexit.register(DB_CONNECTION.close)
+    return DB_CONNECTION
+
 def init_db(reset=False):
     """데이터베이스를 초기화하거나 기존 데이터베이스를 사용합니다."""
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        try:
-            if reset:
-                c.execute("DROP TABLE IF EXISTS news_items")
-                logging.info("기존 news_items 테이블 삭제됨")
-            
-            c.execute('''CREATE TABLE IF NOT EXISTS news_items
-                         (pub_date TEXT,
-                          guid TEXT PRIMARY KEY,
-                          title TEXT,
-                          link TEXT,
-                          topic TEXT,
-                          related_news TEXT)''')
-            
-            c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_guid ON news_items(guid)")
-            
-            # 데이터베이스 무결성 검사
-            c.execute("PRAGMA integrity_check")
-            integrity_result = c.fetchone()[0]
-            if integrity_result != "ok":
-                logging.error(f"데이터베이스 무결성 검사 실패: {integrity_result}")
-                raise sqlite3.IntegrityError("데이터베이스 무결성 검사 실패")
-            
-            # 테이블이 비어있는지 확인
-            c.execute("SELECT COUNT(*) FROM news_items")
-            count = c.fetchone()[0]
-            
-            if reset or count == 0:
-                logging.info("새로운 데이터베이스가 초기화되었습니다.")
-            else:
-                logging.info(f"기존 데이터베이스를 사용합니다. 현재 {count}개의 항목이 있습니다.")
-            
-        except sqlite3.Error as e:
-            logging.error(f"데이터베이스 초기화 중 오류 발생: {e}")
-            raise
-
-    logging.info("데이터베이스 초기화 완료")
-
-def is_guid_posted(guid):
+    c = get_db_connection().cursor()
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            c = conn.cursor()
-            c.execute("SELECT 1 FROM news_items WHERE guid = ?", (guid,))
-            result = c.fetchone() is not None
-            logging.info(f"GUID {guid} 확인 결과: {'이미 게시됨' if result else '새로운 항목'}")
-            return result
-    except sqlite3.Error as e:
-        logging.error(f"데이터베이스 오류 (GUID 확인 중): {e}")
-        return False
-
-def save_news_item(pub_date, guid, title, link, topic, related_news):
-    """뉴스 항목을 데이터베이스에 저장합니다."""
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
+        if reset:
+            c.execute("DROP TABLE IF EXISTS news_items")
+            logging.info("기존 news_items 테이블 삭제됨")
         
-        # 기존 테이블 구조 확인
-        c.execute("PRAGMA table_info(news_items)")
-        columns = [column[1] for column in c.fetchall()]
+        c.execute('''CREATE TABLE IF NOT EXISTS news_items
+                     (pub_date TEXT,
+                      guid TEXT PRIMARY KEY,
+                      title TEXT,
+                      link TEXT,
+                      topic TEXT,
+                      related_news TEXT)''')
         
-        # 관련 뉴스 항목 수 확인
-        related_news_count = len(json.loads(related_news))
+        c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_guid ON news_items(guid)")
         
-        # 필요한 열 추가
-        for i in range(related_news_count):
-            title_col = f"related_title_{i+1}"
-            press_col = f"related_press_{i+1}"
-            link_col = f"related_link_{i+1}"
-            
-            if title_col not in columns:
-                c.execute(f"ALTER TABLE news_items ADD COLUMN {title_col} TEXT")
-            if press_col not in columns:
-                c.execute(f"ALTER TABLE news_items ADD COLUMN {press_col} TEXT")
-            if link_col not in columns:
-                c.execute(f"ALTER TABLE news_items ADD COLUMN {link_col} TEXT")
+        # 관련 뉴스 열은 실행마다 한 번만 확인하여 없는 열을 추가
+        c.execute("PRAGMA table_info(news_items)")
+        existing_columns = {column[1] for column in c.fetchall()}
+        for column in RELATED_NEWS_COLUMNS:
+            if column not in existing_columns:
+                c.execute(f"ALTER TABLE news_items ADD COLUMN {column} TEXT")
         
-        # 데이터 삽입을 위한 SQL 쿼리 준비
-        columns = ["pub_date", "guid", "title", "link", "topic", "related_news"]
-        values = [pub_date, guid, title, link, topic, related_news]
+        # 데이터베이스 무결성 검사
+        c.execute("PRAGMA integrity_check")
+        integrity_result = c.fetchone()[0]
+        if integrity_result != "ok":
+            logging.error(f"데이터베이스 무결성 검사 실패: {integrity_result}")
+            raise sqlite3.IntegrityError("데이터베이스 무결성 검사 실패")
         
-        related_news_items = json.loads(related_news)
-        for i, item in enumerate(related_news_items):
-            columns.extend([f"related_title_{i+1}", f"related_press_{i+1}", f"related_link_{i+1}"])
-            values.extend([item['title'], item['press'], item['link']])
+        # 테이블이 비어있는지 확인
+        c.execute("SELECT COUNT(*) FROM news_items")
+        count = c.fetchone()[0]
         
-        placeholders = ", ".join(["?" for _ in values])
-        columns_str = ", ".join(columns)
+        if reset or count == 0:
+            logging.info("새로운 데이터베이스가 초기화되었습니다.")
+        else:
+            logging.info(f"기존 데이터베이스를 사용합니다. 현재 {count}개의 항목이 있습니다.")
         
-        c.execute(f"INSERT OR REPLACE INTO news_items ({columns_str}) VALUES ({placeholders})", values)
+    except sqlite3.Error as e:
+        logging.error(f"데이터베이스 초기화 중 오류 발생: {e}")
+        raise
+
+    logging.info("데이터베이스 초기화 완료")
+
+def get_posted_guids(guids, chunk_size=500):
+    """주어진 GUID 중 이미 게시된 GUID 집합을 반환합니다.
+
+    전체 기록을 불러오지 않고, 피드에 있는 GUID만 기본 키 색인으로 조회합니다.
+    """
+    guids = list(dict.fromkeys(guids))
+    try:
+        c = get_db_connection().cursor()
+        posted_guids = set()
+        for i in range(0, len(guids), chunk_size):
+            chunk = guids[i:i + chunk_size]
+            placeholders = ", ".join(["?" for _ in chunk])
+            c.execute(f"SELECT guid FROM news_items WHERE guid IN ({placeholders})", chunk)
+            posted_guids.update(row[0] for row in c)
+        logging.info(f"피드의 GUID {len(guids)}개 중 {len(posted_guids)}개가 이미 게시되었습니다.")
+        return posted_guids
+    except sqlite3.Error as e:
+        logging.error(f"데이터베이스 오류 (GUID 확인 중): {e}")
+        return set()
+
+def save_news_items(news_rows):
+    """뉴스 항목들을 하나의 트랜잭션으로 데이터베이스에 저장합니다.
+
+    news_rows의 각 항목은 (pub_date, guid, title, link, topic, related_news) 튜플이며,
+    related_news는 extract_news_items가 반환한 딕셔너리 목록입니다. JSON 직렬화는 여기서 한 번만(orjson 우선) 합니다.
+    """
+    if not news_rows:
+        return
+
+    # 관련 뉴스가 적은 항목은 남는 열을 NULL로 채웁니다
+    values_list = []
+    for pub_date, guid, title, link, topic, related_news in news_rows:
+        related_news_items = related_news[:MAX_RELATED_NEWS]
+        values = [pub_date, guid, title, link, topic, dump_json_bytes(related_news).decode('utf-8')]
+        for item in related_news_items:
+            values.extend((item['title'], item['press'], item['link']))
+        values.extend([None] * (3 * (MAX_RELATED_NEWS - len(related_news_items))))
+        values_list.append(values)
+
+    conn = get_db_connection()
+    with conn:
+        c = conn.cursor()
+        c.execute("BEGIN")
+        c.executemany(INSERT_NEWS_ITEM_SQL, values_list)
         
-        logging.info(f"새 뉴스 항목 저장: {guid}")
+        logging.info(f"새 뉴스 항목 {len(values_list)}개 저장")
 
+@lru_cache(maxsize=4096)  # 실패(예외)는 캐시되지 않으므로 다음 호출에서 다시 시도
 def fetch_decoded_batch_execute(id):
     s = (
         '[[["Fbv4je","[\\"garturlreq\\",[[\\"en-US\\",\\"US\\",[\\"FINANCE_TOP_INDICES\\",\\"WEB_TEST_1_0_0\\"],'
@@ -1014,7 +1175,7 @@ def fetch_decoded_batch_execute(id):
         "Referer": "https://news.google.com/"
     }
 
-    response = requests.post(
+    response = SESSION.post(
         "https://news.google.com/_/DotsSplashUi/data/batchexecute?rpcids=Fbv4je",
         headers=headers,
         data={"f.req": s}
@@ -1038,39 +1199,40 @@ def decode_base64_url_part(encoded_str):
     base64_str = encoded_str.replace("-", "+").replace("_", "/")
     base64_str += "=" * ((4 - len(base64_str) % 4) % 4)
     try:
-        decoded_bytes = base64.urlsafe_b64decode(base64_str)
-        decoded_str = decoded_bytes.decode('latin1')
-        return decoded_str
+        return base64.urlsafe_b64decode(base64_str)
     except Exception as e:
-        return f"디코딩 중 오류 발생: {e}"
+        logging.debug("base64 디코딩 중 오류 발생: %s", e)
+        return b""
 
-def extract_youtube_id(decoded_str):
-    pattern = r'\x08 "\x0b([\w-]{11})\x98\x01\x01'
-    match = re.search(pattern, decoded_str)
+def extract_youtube_id(decoded_bytes):
+    match = YOUTUBE_ID_PATTERN.search(decoded_bytes)
     if match:
-        return match.group(1)
+        return match.group(1).decode('ascii')
     return None
 
-def extract_regular_url(decoded_str):
-    """디코딩된 문자열에서 일반 URL 추출"""
-    parts = re.split(r'[^\x20-\x7E]+', decoded_str)
-    url_pattern = r'(https?://[^\s]+)'
-    for part in parts:
-        match = re.search(url_pattern, part)
-        if match:
-            return match.group(0)
+def extract_regular_url(decoded_bytes):
+    """디코딩된 바이트에서 첫 번째 일반 URL 추출"""
+    match = URL_PATTERN.search(decoded_bytes)
+    if match:
+        return match.group(0).decode('ascii')
     return None
 
 def unescape_unicode(text):
     """유니코드 이스케이프 시퀀스를 실제 문자로 변환합니다."""
-    return re.sub(
-        r'\\u([0-9a-fA-F]{4})',
+    return UNICODE_ESCAPE_PATTERN.sub(
         lambda m: chr(int(m.group(1), 16)),
         text
     )
 
+@lru_cache(maxsize=4096)
 def clean_url(url):
     """URL을 정리하고 유니코드 문자를 처리하는 함수"""
+    # 대부분의 URL은 바꿀 것이 없으므로 파싱과 재구성을 건너뜀
+    # (빈 쿼리/프래그먼트는 urlunparse에서 사라지므로 제외)
+    if (CLEAN_URL_FAST_PATTERN.fullmatch(url) and 'msn.com' not in url
+            and '?#' not in url and not url.endswith(('?', '#'))):
+        return url
+
     # 유니코드 이스케이프 시퀀스 처리
     url = unescape_unicode(url)
     
@@ -1101,54 +1263,73 @@ def clean_url(url):
     
     return cleaned_url
 
-def decode_google_news_url(source_url):
-    url = urlparse(source_url)
-    path = url.path.split("/")
-    if url.hostname == "news.google.com" and len(path) > 1 and path[-2] == "articles":
-        base64_str = path[-1]
-        
-        # 먼저 새로운 방식 시도
-        try:
-            decoded_bytes = base64.urlsafe_b64decode(base64_str + '==')
-            decoded_str = decoded_bytes.decode('latin1')
+@lru_cache(maxsize=8192)
+def decode_google_news_id(base64_str):
+    """Google 뉴스 기사 ID(base64)에서 원본 URL을 추출합니다.
+
+    (URL, 배치 실행 API 조회 필요 여부) 튜플을 반환하며, 추출에 실패하면 URL은 None입니다.
+    네트워크 요청 없이 ID만으로 결정되므로 결과를 캐시합니다.
+    """
+    needs_batch_execute = False
 
-            prefix = b'\x08\x13\x22'.decode('latin1')
-            if decoded_str.startswith(prefix):
-                decoded_str = decoded_str[len(prefix):]
+    # 먼저 새로운 방식 시도
+    try:
+        # bytes 상태로 앞뒤 표식과 길이 바이트를 잘라낸 뒤 그대로 URL 검색
+        decoded_bytes = base64.urlsafe_b64decode(base64_str + '=' * (-len(base64_str) % 4))
 
-            suffix = b'\xd2\x01\x00'.decode('latin1')
-            if decoded_str.endswith(suffix):
-                decoded_str = decoded_str[:-len(suffix)]
+        if decoded_bytes.startswith(b'\x08\x13\x22'):
+            decoded_bytes = decoded_bytes[3:]
 
-            bytes_array = bytearray(decoded_str, 'latin1')
-            length = bytes_array[0]
-            if length >= 0x80:
-                decoded_str = decoded_str[2:length+1]
-            else:
-                decoded_str = decoded_str[1:length+1]
+        if decoded_bytes.endswith(b'\xd2\x01\x00'):
+            decoded_bytes = decoded_bytes[:-3]
 
-            if decoded_str.startswith("AU_yqL"):
-                return clean_url(fetch_decoded_batch_execute(base64_str))
+        length = decoded_bytes[0]
+        if length >= 0x80:
+            decoded_bytes = decoded_bytes[2:length+1]
+        else:
+            decoded_bytes = decoded_bytes[1:length+1]
 
-            regular_url = extract_regular_url(decoded_str)
+        if decoded_bytes.startswith(b"AU_yqL"):
+            needs_batch_execute = True
+        else:
+            regular_url = extract_regular_url(decoded_bytes)
             if regular_url:
-                return clean_url(regular_url)
-        except Exception:
-            pass  # 새로운 방식이 실패하면 기존 방식 시도
+                return clean_url(regular_url), False
+    except Exception:
+        pass  # 새로운 방식이 실패하면 기존 방식 시도
 
-		# 기존 방식 시도 (유튜브 링크 포함)
-        decoded_str = decode_base64_url_part(base64_str)
-        youtube_id = extract_youtube_id(decoded_str)
-        if youtube_id:
-            return f"https://www.youtube.com/watch?v={youtube_id}"
+    # 기존 방식 시도 (유튜브 링크 포함)
+    decoded_bytes = decode_base64_url_part(base64_str)
+    youtube_id = extract_youtube_id(decoded_bytes)
+    if youtube_id:
+        return f"https://www.youtube.com/watch?v={youtube_id}", needs_batch_execute
 
-        regular_url = extract_regular_url(decoded_str)
-        if regular_url:
-            return clean_url(regular_url)
+    regular_url = extract_regular_url(decoded_bytes)
+    if regular_url:
+        return clean_url(regular_url), needs_batch_execute
+
+    return None, needs_batch_execute
+
+def decode_google_news_url(source_url):
+    url = urlparse(source_url)
+    path = url.path.split("/")
+    if url.hostname == "news.google.com" and len(path) > 1 and path[-2] == "articles":
+        base64_str = path[-1]
+        original_url, needs_batch_execute = decode_google_news_id(base64_str)
+
+        if needs_batch_execute:
+            try:
+                return clean_url(fetch_decoded_batch_execute(base64_str))
+            except Exception:
+                pass  # 배치 실행 API가 실패하면 기존 방식 결과 사용
+
+        if original_url:
+            return original_url
 
     return clean_url(source_url)  # 디코딩 실패 시 원본 URL 정리 후 반환
 
-def get_original_url(google_link, session, max_retries=5):
+@lru_cache(maxsize=4096)  # 같은 실행 안에서 반복되는 링크는 리디렉션 요청을 다시 보내지 않음
+def get_original_url(google_link, session=SESSION, max_retries=5):
     # ORIGIN_LINK_TOPIC 설정과 상관없이 항상 원본 링크를 시도
     original_url = decode_google_news_url(google_link)
     if original_url != google_link:
@@ -1158,21 +1339,39 @@ def get_original_url(google_link, session, max_retries=5):
     retries = 0
     while retries < max_retries:
         try:
-            response = session.get(google_link, allow_redirects=True)
-            if response.status_code == 200:
-                return clean_url(response.url)
+            # 최종 URL만 필요하므로 본문은 내려받지 않고 헤더까지만 받음
+            with session.get(google_link, allow_redirects=True, stream=True, timeout=10) as response:
+                if response.status_code == 200:
+                    return clean_url(response.url)
         except requests.RequestException as e:
-            logging.error(f"Failed to get original URL: {e}")
+            logging.error("Failed to get original URL: %s", e)
         retries += 1
 
-    logging.warning(f"오리지널 링크 추출 실패, 원 링크 사용: {google_link}")
+    logging.warning("오리지널 링크 추출 실패, 원 링크 사용: %s", google_link)
     return clean_url(google_link)
 
+def resolve_original_urls(google_links, session=SESSION):
+    """여러 Google 뉴스 링크의 원본 URL을 동시에 확인하여 {Google 링크: 원본 URL} 딕셔너리로 반환합니다."""
+    unique_links = list(dict.fromkeys(link for link in google_links if link))
+    if not unique_links:
+        return {}
+
+    def resolve(google_link):
+        try:
+            return get_original_url(google_link, session)
+        except Exception as e:
+            logging.error("원본 링크 확인 중 오류 발생: %s, %s", google_link, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(ORIGIN_LINK_WORKERS, len(unique_links))) as executor:
+        resolved_urls = executor.map(resolve, unique_links)
+        return {link: url for link, url in zip(unique_links, resolved_urls) if url}
+
 def fetch_rss_feed(url, max_retries=3, retry_delay=5):
     """RSS 피드를 가져옵니다."""
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, timeout=30)
+            response = SESSION.get(url, timeout=30)
             response.raise_for_status()
             return response.content
         except HTTPError as e:
@@ -1195,10 +1394,20 @@ def fetch_rss_feed(url, max_retries=3, retry_delay=5):
             raise
 
 def parse_rss_feed(rss_data):
-    """RSS 피드를 파싱합니다."""
+    """RSS 피드를 스트리밍 방식으로 파싱하여 {태그: 텍스트} 딕셔너리 목록을 반환합니다."""
+    news_items = []
+    channel = None
     try:
-        root = ET.fromstring(rss_data)
-        return root.findall('.//item')
+        for event, elem in ET.iterparse(BytesIO(rss_data), events=('start', 'end'), **ITERPARSE_OPTIONS):
+            if event == 'start':
+                if elem.tag == 'channel':
+                    channel = elem
+            elif elem.tag == 'item':
+                news_items.append({field: elem.findtext(field) for field in RSS_ITEM_FIELDS})
+                elem.clear()  # 필요한 텍스트만 남기고 하위 요소는 바로 해제
+                if channel is not None:
+                    channel.remove(elem)  # 비워진 <item>도 트리에 쌓이지 않도록 제거
+        return news_items
     except ET.ParseError as e:
         logging.error(f"RSS 데이터 파싱 중 오류 발생: {e}")
         raise
@@ -1220,35 +1429,108 @@ def get_rss_url():
 
 def replace_brackets(text):
     """대괄호와 꺾쇠괄호를 유니코드 문자로 대체합니다."""
-    text = text.replace('[', '［').replace(']', '］')
-    text = text.replace('<', '〈').replace('>', '〉')
-    text = re.sub(r'(?<!\s)(?<!^)［', ' ［', text)
-    text = re.sub(r'］(?!\s)', '］ ', text)
-    text = re.sub(r'(?<!\s)(?<!^)〈', ' 〈', text)
-    text = re.sub(r'〉(?!\s)', '〉 ', text)
+    text = text.translate(BRACKET_TRANSLATION)
+    text = BRACKET_SPACING_PATTERN.sub(' ', text)
     return text
 
-def parse_html_description(html_desc, session):
-    """HTML 설명을 파싱하여 뉴스 항목을 추출합니다."""
-    soup = BeautifulSoup(html_desc, 'html.parser')
-    items = soup.find_all('li')
+def match_description_list_items(html_desc):
+    """정형화된 설명 HTML이면 HTML 파서 없이 정규식으로 <li> 튜플 목록을 추출합니다.
+
+    모든 <li>가 DESCRIPTION_ITEM_PATTERN과 일치하지 않으면 None을 반환하여 HTML 파서를 사용하게 합니다.
+    """
+    if '\r' in html_desc or '\x00' in html_desc or '<!' in html_desc:
+        return None  # HTML 파서가 다르게 정규화하거나 건너뛰는 부분(CR, NUL, 주석)
+
+    list_items = []
+    for match in DESCRIPTION_ITEM_PATTERN.finditer(html_desc):
+        href, link_text, separator, press_name, coverage_href, coverage_text = match.groups()
+        if coverage_text is None:
+            href = html.unescape(href)
+            link_text = html.unescape(link_text)
+            press_name = html.unescape(press_name)
+            list_items.append((
+                link_text + html.unescape(separator) + press_name,
+                link_text if href else None,
+                href,
+                press_name
+            ))
+        else:
+            href = html.unescape(coverage_href)
+            link_text = html.unescape(coverage_text)
+            list_items.append((link_text, link_text if href else None, href, None))
+
+    if len(list_items) != html_desc.lower().count('<li'):
+        return None
+    return tuple(list_items)
+
+@lru_cache(maxsize=256)
+def parse_description_list_items(html_desc):
+    """설명 HTML의 각 <li>에서 (전체 텍스트, 링크 텍스트, 링크 주소, 언론사) 튜플 목록을 추출합니다.
+
+    main()의 링크 수집, extract_news_items, parse_html_description이 같은 설명을 다시 파싱하지 않도록 결과를 캐시합니다.
+    """
+    list_items = match_description_list_items(html_desc)
+    if list_items is not None:
+        return list_items
 
+    if LexborHTMLParser is not None:
+        try:
+            list_items = []
+            for li in LexborHTMLParser(html_desc).css('li'):
+                a_tag = li.css_first('a')
+                href = a_tag.attributes.get('href') if a_tag else None
+                font_tag = li.css_first('font[color="#6f6f6f"]')
+                list_items.append((
+                    li.text(),
+                    a_tag.text() if href else None,
+                    href,
+                    font_tag.text() if font_tag else None
+                ))
+            return tuple(list_items)
+        except Exception as e:
+            logging.warning("selectolax 파싱 실패, BeautifulSoup으로 대체합니다: %s", e)
+
+    list_items = []
+    for li in BeautifulSoup(html_desc, BS4_FEATURES, parse_only=LIST_ITEM_STRAINER).find_all('li'):
+        a_tag = li.find('a')
+        href = a_tag.get('href') if a_tag else None
+        font_tag = li.find('font', color="#6f6f6f")
+        list_items.append((
+            li.text,
+            a_tag.text if href else None,
+            href,
+            font_tag.text if font_tag else None
+        ))
+    return tuple(list_items)
+
+def is_full_coverage_item(item_text):
+    """<li> 텍스트가 'Google 뉴스에서 전체 콘텐츠 보기' 링크인지 확인합니다."""
+    return 'Google 뉴스에서 전체 콘텐츠 보기' in item_text or 'View Full Coverage on Google News' in item_text
+
+def parse_html_description(html_desc, session=SESSION, original_urls=None):
+    """HTML 설명을 파싱하여 뉴스 항목을 추출합니다.
+
+    original_urls에 미리 확인한 {Google 링크: 원본 URL}을 넘기면 그 결과를 사용합니다.
+    """
     news_items = []
     full_content_link = ""
-    for item in items:
-        if 'Google 뉴스에서 전체 콘텐츠 보기' in item.text or 'View Full Coverage on Google News' in item.text:
-            full_content_link_match = item.find('a')
-            if full_content_link_match:
-                full_content_link = full_content_link_match['href']
+    list_items = parse_description_list_items(html_desc)
+    if original_urls is None:
+        # 관련 기사 링크는 먼저 모아 한 번에 동시 확인한 뒤, 두 번째 순회에서 메시지를 구성
+        original_urls = resolve_original_urls(
+            [google_link for item_text, _, google_link, press_name in list_items
+             if press_name and not is_full_coverage_item(item_text)],
+            session
+        )
+    for item_text, link_text, google_link, press_name in list_items:
+        if is_full_coverage_item(item_text):
+            if google_link:
+                full_content_link = google_link
             continue
 
-        title_match = item.find('a')
-        press_match = item.find('font', color="#6f6f6f")
-        if title_match and press_match:
-            google_link = title_match['href']
-            link = get_original_url(google_link, session)
-            title_text = replace_brackets(title_match.text)
-            press_name = press_match.text
+        if google_link and press_name:
+            link = original_urls.get(google_link) or get_original_url(google_link, session)
+            title_text = replace_brackets(link_text)
             news_item = f"- [{title_text}](<{link}>) | {press_name}"
             news_items.append(news_item)
 
@@ -1258,29 +1540,39 @@ def parse_html_description(html_desc, session):
 
     return news_string
 
+def format_local_time(pub_datetime, tz, date_format):
+    """파싱된 pubDate를 주어진 시간대와 날짜 형식으로 변환합니다. 시간대가 없으면 UTC 기준으로 표시합니다."""
+    if tz:
+        return pub_datetime.astimezone(tz).strftime(date_format)
+    else:
+        return pub_datetime.strftime('%Y-%m-%d %H:%M:%S')
+
 def convert_to_local_time(pub_date, country_code):
     try:
-        utc_time = parsedate_to_datetime(pub_date)
-    except ValueError:
+        pub_datetime = parse_pub_date(pub_date)
+    except (TypeError, ValueError):
         return pub_date
 
-    if country_code in country_configs:
-        _, _, _, _, _, _, timezone, date_format = country_configs[country_code]
-        local_time = utc_time.astimezone(pytz.timezone(timezone))
-        return local_time.strftime(date_format)
-    else:
-        return utc_time.strftime('%Y-%m-%d %H:%M:%S')
+    config = get_country_config(country_code)
+    if config:
+        return format_local_time(pub_datetime, COUNTRY_TIMEZONES.get(country_code), config.date_format)
+    return format_local_time(pub_datetime, None, None)
+
+def parse_pub_date(pub_date):
+    """RSS pubDate(RFC 2822)를 datetime으로 변환합니다. 다른 형식이면 dateutil로 파싱합니다."""
+    try:
+        return parsedate_to_datetime(pub_date)
+    except (TypeError, ValueError):
+        return parser.parse(pub_date)
 
 def parse_rss_date(pub_date, country_code):
     return convert_to_local_time(pub_date, country_code)
 
-def format_discord_message(news_item, news_prefix, category, topic_name, country_emoji, country_code):
+def format_discord_message(news_item, runtime_config):
     try:
-        formatted_date = parse_rss_date(news_item['pub_date'], country_code)
-
-        discord_source = f"`{news_prefix} - {category} - {topic_name} {country_emoji}`"
+        formatted_date = format_local_time(news_item['pub_datetime'], runtime_config.timezone, runtime_config.date_format)
 
-        message = f"{discord_source}\n**{news_item['title']}**\n{news_item['link']}"
+        message = f"{runtime_config.discord_source}\n**{news_item['title']}**\n{news_item['link']}"
         
         if news_item['description']:
             message += f"\n>>> {news_item['description']}\n\n"
@@ -1290,9 +1582,39 @@ def format_discord_message(news_item, news_prefix, category, topic_name, country
         message += f"📅 {formatted_date}"
         return message
     except Exception as e:
-        logging.error(f"메시지 포맷팅 중 오류 발생: {e}")
+        logging.error("메시지 포맷팅 중 오류 발생: %s", e)
         return None
 	    
+def dump_json_bytes(obj):
+    """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def parse_discord_wait_seconds(value, default=1.0):
+    """Discord가 알려준 대기 시간 값을 초 단위 실수로 변환합니다. 값이 잘못되었으면 기본값을 사용합니다."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return default
+    # 음수, NaN, 무한대는 time.sleep에 넘길 수 없으므로 기본값으로 대체
+    return seconds if 0 <= seconds < float('inf') else default
+
+def get_discord_retry_after(response):
+    """Discord 429 응답에서 재시도까지 기다릴 시간(초)을 구합니다."""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        retry_after = body.get('retry_after') if isinstance(body, dict) else None
+    return parse_discord_wait_seconds(retry_after)
+
+def get_discord_reset_after(response):
+    """Discord 응답 헤더에서 속도 제한 버킷이 초기화될 때까지의 시간(초)을 구합니다."""
+    return parse_discord_wait_seconds(response.headers.get('X-RateLimit-Reset-After'))
+
 def send_discord_message(webhook_url, message, avatar_url=None, username=None, max_retries=3, retry_delay=5):
     """Discord 웹훅을 사용하여 메시지를 전송합니다. 실패 시 재시도합니다."""
     payload = {"content": message}
@@ -1304,64 +1626,112 @@ def send_discord_message(webhook_url, message, avatar_url=None, username=None, m
         payload["username"] = username
     
     headers = {"Content-Type": "application/json"}
+    data = dump_json_bytes(payload)
 
     for attempt in range(max_retries):
         try:
-            response = requests.post(webhook_url, json=payload, headers=headers)
+            response = SESSION.post(webhook_url, data=data, headers=headers)
+            if response.status_code == 429 and attempt < max_retries - 1:
+                # 속도 제한에 걸린 경우 서버가 알려준 시간만큼만 대기 후 재시도
+                retry_after = get_discord_retry_after(response)
+                logging.warning("Discord 속도 제한 도달 (시도 %d/%d). %s초 후 재시도합니다.", attempt + 1, max_retries, retry_after)
+                time.sleep(retry_after)
+                continue
             response.raise_for_status()  # 4xx, 5xx 상태 코드에 대해 예외를 발생시킵니다.
             logging.info("Discord에 메시지 게시 완료")
+
+            # 남은 요청 수가 없으면 속도 제한 버킷이 초기화될 때까지 대기
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                reset_after = get_discord_reset_after(response)
+                logging.info("Discord 속도 제한 버킷 소진, %s초 대기합니다.", reset_after)
+                time.sleep(reset_after)
             return  # 성공적으로 전송되면 함수 종료
         except requests.RequestException as e:
             if attempt < max_retries - 1:
-                logging.warning(f"Discord 메시지 전송 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                time.sleep(retry_delay)
+                # 5xx 등 일시적인 오류는 재시도할 때마다 대기 시간을 두 배로 늘립니다
+                delay = retry_delay * (2 ** attempt)
+                logging.warning("Discord 메시지 전송 실패 (시도 %d/%d): %s. %s초 후 재시도합니다.", attempt + 1, max_retries, e, delay)
+                time.sleep(delay)
             else:
-                logging.error(f"Discord 메시지 전송 최종 실패: {e}")
+                logging.error("Discord 메시지 전송 최종 실패: %s", e)
                 raise  # 모든 재시도가 실패하면 예외를 발생시킵니다.
 
-    time.sleep(3)  # 성공적인 전송 후 3초 대기
+def extract_news_items(description, session=SESSION, original_urls=None):
+    """HTML 설명에서 뉴스 항목을 추출합니다.
 
-def extract_news_items(description, session):
-    """HTML 설명에서 뉴스 항목을 추출합니다."""
-    soup = BeautifulSoup(description, 'html.parser')
+    original_urls에 미리 확인한 {Google 링크: 원본 URL}을 넘기면 그 결과를 사용합니다.
+    """
     news_items = []
-    for li in soup.find_all('li'):
-        a_tag = li.find('a')
-        if a_tag:
-            title = replace_brackets(a_tag.text)
-            google_link = a_tag['href']
-            link = get_original_url(google_link, session)
-            press = li.find('font', color="#6f6f6f").text if li.find('font', color="#6f6f6f") else ""
+    list_items = parse_description_list_items(description)
+    if original_urls is None:
+        original_urls = resolve_original_urls([google_link for _, _, google_link, _ in list_items], session)
+    for _, link_text, google_link, press_name in list_items:
+        if google_link:
+            title = replace_brackets(link_text)
+            link = original_urls.get(google_link) or get_original_url(google_link, session)
+            press = press_name or ""
             news_items.append({"title": title, "link": link, "press": press})
     return news_items
 
+@lru_cache(maxsize=None)
+def compile_advanced_filter(advanced_filter):
+    """고급 검색 쿼리를 (포함해야 하는 단어 튜플, 제외 단어 정규식) 형태로 한 번만 파싱합니다."""
+    include_terms = []
+    exclude_terms = []
+
+    # 정규 표현식을 사용하여 고급 검색 쿼리 파싱
+    for prefix, term in FILTER_TERM_PATTERN.findall(advanced_filter):
+        term = term.lower() if term else prefix.lower()
+        if prefix == '+' or not prefix:  # 포함해야 하는 단어
+            include_terms.append(term)
+        elif prefix == '-':  # 제외해야 하는 단어 또는 구문
+            # 여러 단어로 구성된 제외 구문 처리
+            phrase_terms = term.split()
+            exclude_terms.append(' '.join(phrase_terms) if len(phrase_terms) > 1 else term)
+
+    # 제외 단어는 하나의 정규식으로 묶어 본문을 한 번만 검사합니다
+    exclude_pattern = re.compile('|'.join(map(re.escape, exclude_terms))) if exclude_terms else None
+    return tuple(include_terms), exclude_pattern
+
 def apply_advanced_filter(title, description, advanced_filter):
     """고급 검색 필터를 적용하여 게시물을 전송할지 결정합니다."""
     if not advanced_filter:
         return True
+    return match_advanced_filter(title, description, compile_advanced_filter(advanced_filter))
 
-    text_to_check = (title + ' ' + description).lower()
+def match_advanced_filter(title, description, compiled_filter):
+    """compile_advanced_filter로 미리 파싱한 필터를 게시물에 적용합니다."""
+    include_terms, exclude_pattern = compiled_filter
+    if not include_terms and not exclude_pattern:
+        return True  # 검사할 단어가 없으면 본문을 소문자로 바꿀 필요도 없음
 
-    # 정규 표현식을 사용하여 고급 검색 쿼리 파싱
-    terms = re.findall(r'([+-]?)(?:"([^"]*)"|\S+)', advanced_filter)
+    text_to_check = (title + ' ' + description).lower()
 
-    for prefix, term in terms:
-        term = term.lower() if term else prefix.lower()
-        if prefix == '+' or not prefix:  # 포함해야 하는 단어
-            if term not in text_to_check:
-                return False
-        elif prefix == '-':  # 제외해야 하는 단어 또는 구문
-            # 여러 단어로 구성된 제외 구문 처리
-            exclude_terms = term.split()
-            if len(exclude_terms) > 1:
-                if ' '.join(exclude_terms) in text_to_check:
-                    return False
-            else:
-                if term in text_to_check:
-                    return False
+    if not all(term in text_to_check for term in include_terms):
+        return False
+    if exclude_pattern and exclude_pattern.search(text_to_check):
+        return False
 
     return True
 
+def is_excluded_before_resolve(item, compiled_filter):
+    """원본 링크를 확인하기 전에 제목, 관련 기사 제목, 언론사만으로 제외 단어를 검사합니다.
+
+    이 문자열들은 match_advanced_filter가 검사하는 본문에 그대로 들어가므로,
+    여기서 제외되는 항목은 전체 검사에서도 반드시 제외됩니다. (포함 단어는 링크에 있을 수 있어 검사하지 않음)
+    """
+    exclude_pattern = compiled_filter[1]
+    if not exclude_pattern:
+        return False
+
+    segments = [replace_brackets(item['title'] or '')]
+    if item['description']:
+        for item_text, link_text, google_link, press_name in parse_description_list_items(item['description']):
+            if google_link and press_name and not is_full_coverage_item(item_text):
+                segments.append(replace_brackets(link_text))
+                segments.append(press_name)
+    return any(exclude_pattern.search(segment.lower()) for segment in segments)
+
 def parse_date_filter(filter_string):
     since_date = None
     until_date = None
@@ -1373,29 +1743,29 @@ def parse_date_filter(filter_string):
         logging.warning("날짜 필터 문자열이 비어있습니다.")
         return since_date, until_date, past_date
 
-    since_match = re.search(r'since:(\d{4}-\d{2}-\d{2})', filter_string)
-    until_match = re.search(r'until:(\d{4}-\d{2}-\d{2})', filter_string)
+    since_match = SINCE_FILTER_PATTERN.search(filter_string)
+    until_match = UNTIL_FILTER_PATTERN.search(filter_string)
     
     if since_match:
-        since_date = datetime.strptime(since_match.group(1), '%Y-%m-%d').replace(tzinfo=pytz.UTC)
+        since_date = datetime.strptime(since_match.group(1), '%Y-%m-%d').replace(tzinfo=timezone.utc)
         logging.info(f"since_date 파싱 결과: {since_date}")
     if until_match:
-        until_date = datetime.strptime(until_match.group(1), '%Y-%m-%d').replace(tzinfo=pytz.UTC)
+        until_date = datetime.strptime(until_match.group(1), '%Y-%m-%d').replace(tzinfo=timezone.utc)
         logging.info(f"until_date 파싱 결과: {until_date}")
 
-    past_match = re.search(r'past:(\d+)([hdmy])', filter_string)
+    past_match = PAST_FILTER_PATTERN.search(filter_string)
     if past_match:
         value = int(past_match.group(1))
         unit = past_match.group(2)
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(timezone.utc)
         if unit == 'h':
             past_date = now - timedelta(hours=value)
         elif unit == 'd':
             past_date = now - timedelta(days=value)
         elif unit == 'm':
-            past_date = now - timedelta(days=value*30)  # 근사값 사용
+            past_date = now - relativedelta(months=value)  # 달력 기준 개월 수
         elif unit == 'y':
-            past_date = now - timedelta(days=value*365)  # 근사값 사용
+            past_date = now - relativedelta(years=value)  # 달력 기준 연 수 (윤년 포함)
         logging.info(f"past_date 파싱 결과: {past_date}")
     else:
         logging.warning("past: 형식의 날짜 필터를 찾을 수 없습니다.")
@@ -1403,62 +1773,88 @@ def parse_date_filter(filter_string):
     logging.info(f"최종 파싱 결과 - since_date: {since_date}, until_date: {until_date}, past_date: {past_date}")
     return since_date, until_date, past_date
 
-def is_within_date_range(pub_date, since_date, until_date, past_date):
+def is_within_date_range(pub_datetime, since_date, until_date, past_date):
     try:
-        pub_datetime = parser.parse(pub_date).replace(tzinfo=pytz.UTC)
-        now = datetime.now(pytz.UTC)
-        
-        logging.info(f"검사 중인 기사 날짜: {pub_datetime}")
-        logging.info(f"현재 날짜: {now}")
-        logging.info(f"설정된 필터 - since_date: {since_date}, until_date: {until_date}, past_date: {past_date}")
+        pub_datetime = pub_datetime.replace(tzinfo=timezone.utc)
+        logging.debug("검사 중인 기사 날짜: %s", pub_datetime)
 
         if past_date:
             result = pub_datetime >= past_date
-            logging.info(f"past_date 필터 적용 결과: {result}")
+            logging.debug("past_date 필터 적용 결과: %s", result)
             return result
         
         if since_date and pub_datetime < since_date:
-            logging.info(f"since_date 필터에 의해 제외됨")
+            logging.debug("since_date 필터에 의해 제외됨")
             return False
         if until_date and pub_datetime > until_date:
-            logging.info(f"until_date 필터에 의해 제외됨")
+            logging.debug("until_date 필터에 의해 제외됨")
             return False
         
-        logging.info(f"모든 날짜 필터를 통과함")
+        logging.debug("모든 날짜 필터를 통과함")
         return True
     except Exception as e:
-        logging.error(f"날짜 처리 중 오류 발생: {e}")
+        logging.error("날짜 처리 중 오류 발생: %s", e)
         return True  # 오류 발생 시 기본적으로 포함시킴
 
+RuntimeConfig = namedtuple('RuntimeConfig', 'rss_url topic_name lang country_code timezone date_format discord_source topic_label')
+
+def build_runtime_config():
+    """실행 중 바뀌지 않는 설정(RSS URL, 토픽, 국가 시간대, 메시지 머리말 등)을 한 번만 계산합니다."""
+    rss_url, topic_name, lang = get_rss_url()
+
+    gl_param = GL_PARAM_PATTERN.search(TOPIC_PARAMS)
+    country_code = gl_param.group(1) if gl_param else 'KR'
+    country_config = get_country_config(country_code)
+
+    news_prefix = get_news_prefix(lang)
+    category = get_topic_category(TOPIC_KEYWORD, lang) if TOPIC_MODE else TOPIC_CATEGORY.get(lang, "Topics")
+
+    return RuntimeConfig(
+        rss_url=rss_url,
+        topic_name=topic_name,
+        lang=lang,
+        country_code=country_code,
+        timezone=COUNTRY_TIMEZONES.get(country_code),
+        date_format=country_config.date_format if country_config else None,
+        discord_source=f"`{news_prefix} - {category} - {topic_name} {get_country_emoji(country_code)}`",
+        topic_label=TOPIC_KEYWORD if TOPIC_MODE else "general"
+    )
+
 def main():
     """메인 함수: RSS 피드를 가져와 처리하고 Discord로 전송합니다."""
     try:
-        rss_url, topic_name, lang = get_rss_url()
+        runtime_config = build_runtime_config()
         
-        logging.info(f"RSS 피드 URL: {rss_url}")
+        logging.info(f"RSS 피드 URL: {runtime_config.rss_url}")
         logging.debug(f"ORIGIN_LINK_TOPIC 값: {ORIGIN_LINK_TOPIC}")
 
-        rss_data = fetch_rss_feed(rss_url)
-        root = ET.fromstring(rss_data)
-        news_items = root.findall('.//item')
+        rss_data = fetch_rss_feed(runtime_config.rss_url)
+        news_items = parse_rss_feed(rss_data)
         
         total_items = len(news_items)
         logging.info(f"총 {total_items}개의 뉴스 항목을 가져왔습니다.")
 
         init_db(reset=INITIALIZE_TOPIC)
 
-        session = requests.Session()
-        
-        with sqlite3.connect(DB_PATH) as conn:
-            if INITIALIZE_TOPIC:
-                new_items = news_items
-                logging.info("초기 실행: 모든 뉴스 항목을 처리합니다.")
-            else:
-                new_items = [item for item in news_items if not is_guid_posted(item.find('guid').text)]
-                logging.info(f"후속 실행: {len(new_items)}개의 새로운 뉴스 항목을 처리합니다.")
+        if INITIALIZE_TOPIC:
+            new_items = news_items
+            logging.info("초기 실행: 모든 뉴스 항목을 처리합니다.")
+        else:
+            posted_guids = get_posted_guids(item['guid'] for item in news_items)
+            new_items = []
+            for item in news_items:
+                guid = item['guid']
+                if guid not in posted_guids:
+                    posted_guids.add(guid)  # 피드 안의 중복 GUID도 한 번만 처리
+                    new_items.append(item)
+            logging.info(f"후속 실행: {len(new_items)}개의 새로운 뉴스 항목을 처리합니다.")
+
+        # pubDate는 항목마다 한 번만 파싱하여 정렬, 날짜 필터, 메시지 포맷에 재사용
+        for item in new_items:
+            item['pub_datetime'] = parse_pub_date(item['pubDate'])
 
         # 날짜를 기준으로 오래된 순서에서 최신 순서로 정렬
-        new_items.sort(key=lambda item: parser.parse(item.find('pubDate').text))
+        new_items.sort(key=lambda item: item['pub_datetime'])
 
         if not new_items:
             logging.info("처리할 새로운 뉴스 항목이 없습니다.")
@@ -1467,70 +1863,81 @@ def main():
         since_date, until_date, past_date = parse_date_filter(DATE_FILTER_TOPIC)
         logging.debug(f"적용된 날짜 필터 - since: {since_date}, until: {until_date}, past: {past_date}")
 
-        gl_param = re.search(r'gl=(\w+)', TOPIC_PARAMS)
-        country_code = gl_param.group(1) if gl_param else 'KR'
-        country_emoji = get_country_emoji(country_code)
-        news_prefix = get_news_prefix(lang)
-        category = get_topic_category(TOPIC_KEYWORD, lang) if TOPIC_MODE else TOPIC_CATEGORY.get(lang, "Topics")
+        # 고급 검색 필터는 반복문 밖에서 한 번만 파싱
+        compiled_filter = compile_advanced_filter(ADVANCED_FILTER_TOPIC) if ADVANCED_FILTER_TOPIC else None
 
-        processed_count = 0
+        # 날짜 필터와 링크가 필요 없는 제외 단어 검사를 먼저 적용한 뒤, 남은 항목의 원본 링크를 한 번에 동시 확인
+        target_items = []
         for item in new_items:
-            try:
-                guid = item.find('guid').text
-                pub_date = item.find('pubDate').text
-                if not is_within_date_range(pub_date, since_date, until_date, past_date):
-                    logging.debug(f"날짜 필터에 의해 건너뛰어진 뉴스: {item.find('title').text}")
-                    continue
-
-                title = replace_brackets(item.find('title').text)
-                google_link = item.find('link').text
-                link = get_original_url(google_link, session)
-                description_html = item.find('description').text
-
-                related_news = extract_news_items(description_html, session)
-                related_news_json = json.dumps(related_news, ensure_ascii=False)
-
-                description = parse_html_description(description_html, session)
+            if not is_within_date_range(item['pub_datetime'], since_date, until_date, past_date):
+                logging.debug("날짜 필터에 의해 건너뛰어진 뉴스: %s", item['title'])
+            elif compiled_filter and is_excluded_before_resolve(item, compiled_filter):
+                logging.info("고급 검색 필터에 의해 건너뛰어진 뉴스: %s", item['title'])
+            else:
+                target_items.append(item)
 
-                if not apply_advanced_filter(title, description, ADVANCED_FILTER_TOPIC):
-                    logging.info(f"고급 검색 필터에 의해 건너뛰어진 뉴스: {title}")
-                    continue
+        # 본문 링크와 모든 설명 속 관련 기사 링크를 모아 한 번에 동시 확인
+        google_links = []
+        for item in target_items:
+            google_links.append(item['link'])
+            if item['description']:
+                google_links.extend(google_link for _, _, google_link, _ in parse_description_list_items(item['description']))
+        original_urls = resolve_original_urls(google_links)
 
-                news_item = {
-                    "guid": guid,
-                    "title": title,
-                    "link": link,
-                    "pub_date": pub_date,
-                    "description": description
-                }
-
-                discord_message = format_discord_message(
-                    news_item,
-                    news_prefix,
-                    category,
-                    topic_name,
-                    country_emoji,
-                    country_code
-                )
+        processed_count = 0
+        saved_rows = []
+        try:
+            for item in target_items:
+                try:
+                    guid = item['guid']
+                    pub_date = item['pubDate']
+
+                    title = replace_brackets(item['title'])
+                    google_link = item['link']
+                    link = original_urls.get(google_link) or get_original_url(google_link)
+                    description_html = item['description']
+
+                    related_news = extract_news_items(description_html, original_urls=original_urls)
+
+                    description = parse_html_description(description_html, original_urls=original_urls)
+
+                    if compiled_filter and not match_advanced_filter(title, description, compiled_filter):
+                        logging.info("고급 검색 필터에 의해 건너뛰어진 뉴스: %s", title)
+                        continue
+
+                    news_item = {
+                        "guid": guid,
+                        "title": title,
+                        "link": link,
+                        "pub_date": pub_date,
+                        "pub_datetime": item['pub_datetime'],
+                        "description": description
+                    }
+
+                    discord_message = format_discord_message(news_item, runtime_config)
                 
-                if discord_message:
-                    send_discord_message(
-                        DISCORD_WEBHOOK_TOPIC,
-                        discord_message,
-                        avatar_url=DISCORD_AVATAR_TOPIC,
-                        username=DISCORD_USERNAME_TOPIC
-                    )
+                    if discord_message:
+                        send_discord_message(
+                            DISCORD_WEBHOOK_TOPIC,
+                            discord_message,
+                            avatar_url=DISCORD_AVATAR_TOPIC,
+                            username=DISCORD_USERNAME_TOPIC
+                        )
 
-                    save_news_item(pub_date, guid, title, link, TOPIC_KEYWORD if TOPIC_MODE else "general", related_news_json)
+                        saved_rows.append((pub_date, guid, title, link, runtime_config.topic_label, related_news))
 
-                    processed_count += 1
-                    logging.info(f"뉴스 항목 처리 완료: {title}")
+                        processed_count += 1
+                        logging.info("뉴스 항목 처리 완료: %s", title)
 
-            except Exception as e:
-                logging.error(f"뉴스 항목 '{item.find('title').text if item.find('title') is not None else 'Unknown'}' 처리 중 오류 발생: {e}", exc_info=True)
-                continue
+                except Exception as e:
+                    logging.error("뉴스 항목 '%s' 처리 중 오류 발생: %s", item['title'] or 'Unknown', e, exc_info=True)
+                    continue
+        finally:
+            # 전송된 항목은 중간에 오류가 나더라도 한 번에 저장합니다
+            save_news_items(saved_rows)
 
         logging.info(f"총 {processed_count}개의 뉴스 항목이 성공적으로 처리되었습니다.")
+        logging.debug(f"URL 캐시 - get_original_url: {get_original_url.cache_info()}, decode_google_news_id: {decode_google_news_id.cache_info()}, fetch_decoded_batch_execute: {fetch_decoded_batch_execute.cache_info()}, clean_url: {clean_url.cache_info()}")
 
     except Exception as e:
         logging.error(f"프로그램 실행 중 오류 발생: {e}", exc_info=True)
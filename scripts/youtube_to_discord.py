@@ -3,11 +3,17 @@ import re
 import logging
 import sqlite3
 import sys
-from typing import List, Dict, Any, Tuple, Set
+import atexit
+from typing import List, Dict, Any, Tuple, Set, Optional
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from operator import itemgetter
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 import isodate
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -15,6 +21,21 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 # DB 설정
 DB_PATH = 'youtube_videos.db'
+DB_CONNECTION = None  # get_db_connection()에서 생성하는 공유 연결
+
+# 동영상 저장 SQL (같은 문자열 객체를 재사용해 sqlite3 문장 캐시가 재파싱을 건너뛰도록 함)
+INSERT_VIDEO_SQL = '''
+    INSERT OR REPLACE INTO videos
+    (video_id, channel_id, channel_title, title, description, published_at,
+     thumbnail_url, category_id, category_name, duration, tags,
+     live_broadcast_content, scheduled_start_time, caption,
+     view_count, like_count, comment_count, source)
+    VALUES
+    (:video_id, :channel_id, :channel_title, :title, :description, :published_at,
+     :thumbnail_url, :category_id, :category_name, :duration, :tags,
+     :live_broadcast_content, :scheduled_start_time, :caption,
+     :view_count, :like_count, :comment_count, :source)
+'''
 
 # 환경 변수
 YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
@@ -40,7 +61,35 @@ YOUTUBE_DETAILVIEW = os.getenv('YOUTUBE_DETAILVIEW', 'false').lower() == 'true'
 # 전역 변수: 디스코드 메시지 전송을 위한 변수
 discord_message_count = 0
 discord_message_reset_time = time.time()
+discord_message_lock = threading.Lock()
 category_cache = {}
+category_cache_loaded = False
+channel_thumbnail_cache = {}
+
+# Discord 웹훅 호출에 재사용하는 HTTP 세션 (keep-alive로 연결을 유지)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0))
+atexit.register(SESSION.close)
+DISCORD_HEADERS = {'Content-Type': 'application/json'}
+
+# videos.list 응답에서 process_new_videos가 실제로 사용하는 필드만 요청합니다
+VIDEO_DETAIL_FIELDS = (
+    "items(id,"
+    "snippet(publishedAt,channelId,channelTitle,title,description,thumbnails/high/url,categoryId,tags,liveBroadcastContent),"
+    "contentDetails(duration,caption),"
+    "statistics(viewCount,likeCount,commentCount),"
+    "liveStreamingDetails(scheduledStartTime))"
+)
+
+# 재생목록 항목은 ID, 공개 상태, 정렬 기준만 필요합니다 (세부 정보는 videos.list에서 가져옴)
+PLAYLIST_ITEM_FIELDS = "items(snippet(publishedAt,position),contentDetails/videoId,status/privacyStatus),nextPageToken"
+
+# 정규 표현식 (모듈 로드 시 한 번만 컴파일)
+FILTER_TERM_PATTERN = re.compile(r'([+-]?)(?:"([^"]*)"|\S+)')
+SINCE_FILTER_PATTERN = re.compile(r'since:(\d{4}-\d{2}-\d{2})')
+UNTIL_FILTER_PATTERN = re.compile(r'until:(\d{4}-\d{2}-\d{2})')
+PAST_FILTER_PATTERN = re.compile(r'past:(\d+)([hdmy])')
+DURATION_PATTERN = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -136,8 +185,13 @@ def check_env_variables() -> Dict[str, Any]:
 	
 def parse_duration(duration: str) -> str:
     """영상 길이를 파싱합니다."""
-    parsed_duration = isodate.parse_duration(duration)
-    total_seconds = int(parsed_duration.total_seconds())
+    duration_match = DURATION_PATTERN.fullmatch(duration)
+    if duration_match:
+        hours, minutes, seconds = (int(value or 0) for value in duration_match.groups())
+        total_seconds = hours * 3600 + minutes * 60 + seconds
+    else:
+        # 일(D)/주(W) 단위 등 드문 형식은 isodate로 처리
+        total_seconds = int(isodate.parse_duration(duration).total_seconds())
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
     if LANGUAGE_YOUTUBE == 'Korean':
@@ -155,9 +209,14 @@ def parse_duration(duration: str) -> str:
         else:
             return f"{seconds}s"
 
+@lru_cache(maxsize=1024)
+def parse_published_at(published_at: str) -> datetime:
+    """YouTube의 publishedAt 문자열(예: 2024-01-01T00:00:00Z)을 UTC datetime으로 변환합니다."""
+    # Python 3.11 미만의 fromisoformat은 'Z' 접미사를 지원하지 않으므로 오프셋으로 바꿉니다
+    return datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+
 def convert_to_local_time(published_at: str) -> str:
-    utc_time = datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ")
-    utc_time = utc_time.replace(tzinfo=timezone.utc)
+    utc_time = parse_published_at(published_at)
     
     if LANGUAGE_YOUTUBE == 'Korean':
         kst_time = utc_time + timedelta(hours=9)
@@ -166,29 +225,34 @@ def convert_to_local_time(published_at: str) -> str:
         local_time = utc_time.astimezone()
         return local_time.strftime("%Y-%m-%d %H:%M:%S") 
 
+@lru_cache(maxsize=8)
+def compile_advanced_filter(advanced_filter: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """고급 필터를 (포함해야 하는 단어 튜플, 제외해야 하는 단어 튜플) 형태로 한 번만 파싱합니다."""
+    include_terms = []
+    exclude_terms = []
+
+    for prefix, term in FILTER_TERM_PATTERN.findall(advanced_filter):
+        term = term.lower() if term else prefix.lower()
+        if prefix == '+' or not prefix:  # 포함해야 하는 단어
+            include_terms.append(term)
+        elif prefix == '-':  # 제외해야 하는 단어 또는 구문
+            phrase_terms = term.split()
+            exclude_terms.append(' '.join(phrase_terms) if len(phrase_terms) > 1 else term)
+
+    return tuple(include_terms), tuple(exclude_terms)
+
 def apply_advanced_filter(title: str, advanced_filter: str) -> bool:
     """고급 필터를 적용하여 제목을 필터링합니다."""
     if not advanced_filter:
         return True
 
-    text_to_check = title.lower()
-    terms = re.findall(r'([+-]?)(?:"([^"]*)"|\S+)', advanced_filter)
-
-    for prefix, term in terms:
-        term = term.lower() if term else prefix.lower()
-        if prefix == '+' or not prefix:  # 포함해야 하는 단어
-            if term not in text_to_check:
-                return False
-        elif prefix == '-':  # 제외해야 하는 단어 또는 구문
-            exclude_terms = term.split()
-            if len(exclude_terms) > 1:
-                if ' '.join(exclude_terms) in text_to_check:
-                    return False
-            else:
-                if term in text_to_check:
-                    return False
+    include_terms, exclude_terms = compile_advanced_filter(advanced_filter)
+    if not include_terms and not exclude_terms:
+        return True
 
-    return True
+    text_to_check = title.lower()
+    return (all(term in text_to_check for term in include_terms)
+            and not any(term in text_to_check for term in exclude_terms))
 
 def parse_date_filter(filter_string: str) -> Tuple[datetime, datetime, datetime]:
     """날짜 필터를 파싱합니다."""
@@ -200,8 +264,8 @@ def parse_date_filter(filter_string: str) -> Tuple[datetime, datetime, datetime]
         logging.warning("날짜 필터 문자열이 비어있습니다.")
         return since_date, until_date, past_date
 
-    since_match = re.search(r'since:(\d{4}-\d{2}-\d{2})', filter_string)
-    until_match = re.search(r'until:(\d{4}-\d{2}-\d{2})', filter_string)
+    since_match = SINCE_FILTER_PATTERN.search(filter_string)
+    until_match = UNTIL_FILTER_PATTERN.search(filter_string)
     
     if since_match:
         since_date = datetime.strptime(since_match.group(1), '%Y-%m-%d').replace(tzinfo=timezone.utc)
@@ -210,7 +274,7 @@ def parse_date_filter(filter_string: str) -> Tuple[datetime, datetime, datetime]
         until_date = datetime.strptime(until_match.group(1), '%Y-%m-%d').replace(tzinfo=timezone.utc)
         logging.info(f"until_date 파싱 결과: {until_date}")
 
-    past_match = re.search(r'past:(\d+)([hdmy])', filter_string)
+    past_match = PAST_FILTER_PATTERN.search(filter_string)
     if past_match:
         value = int(past_match.group(1))
         unit = past_match.group(2)
@@ -230,43 +294,75 @@ def parse_date_filter(filter_string: str) -> Tuple[datetime, datetime, datetime]
     logging.info(f"최종 파싱 결과 - since_date: {since_date}, until_date: {until_date}, past_date: {past_date}")
     return since_date, until_date, past_date
 
-def is_within_date_range(published_at: str, since_date: datetime, until_date: datetime, past_date: datetime) -> bool:
-    """게시물이 날짜 필터 범위 내에 있는지 확인합니다."""
-
+def get_date_bounds(since_date: datetime, until_date: datetime, past_date: datetime) -> Optional[Tuple[datetime, datetime]]:
+    """세 날짜 필터의 교집합을 (하한, 상한) 형태로 한 번만 계산합니다. 필터가 없으면 None을 반환합니다."""
     if not any([since_date, until_date, past_date]):
+        return None
+
+    lower_bounds = [date for date in (since_date, past_date) if date]
+    lower = max(lower_bounds) if lower_bounds else datetime.min.replace(tzinfo=timezone.utc)
+    upper = until_date or datetime.max.replace(tzinfo=timezone.utc)
+    return lower, upper
+
+def is_within_date_range(published_at: str, date_bounds: Optional[Tuple[datetime, datetime]]) -> bool:
+    """게시물이 날짜 필터 범위(모든 조건의 교집합) 내에 있는지 확인합니다."""
+    if date_bounds is None:
         return True  # 날짜 필터가 설정되지 않은 경우 모든 비디오 포함
 
-    pub_datetime = datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-    
-    if past_date and pub_datetime >= past_date:
-        return True
-    if since_date and pub_datetime >= since_date:
-        return True
-    if until_date and pub_datetime <= until_date:
-        return True
-    
-    return False
+    lower, upper = date_bounds
+    return lower <= parse_published_at(published_at) <= upper
+
+def prime_category_cache(youtube) -> None:
+    """전체 카테고리 목록을 한 번만 가져와 category_cache를 채웁니다."""
+    global category_cache_loaded
+    if category_cache_loaded:
+        return
+    category_cache_loaded = True  # 실패하더라도 실행 중에는 다시 호출하지 않음
 
-def get_category_name(youtube, category_id: str) -> str:
-    """카테고리 ID를 카테고리 이름으로 변환합니다."""
-    if category_id in category_cache:
-        return category_cache[category_id]
-    
     try:
         categories = youtube.videoCategories().list(part="snippet", regionCode="US").execute()
         for category in categories['items']:
             category_cache[category['id']] = category['snippet']['title']
-            if category['id'] == category_id:
-                return category['snippet']['title']
-        return "Unknown"
     except Exception as e:
         logging.error(f"카테고리 이름을 가져오는 데 실패했습니다: {e}")
-        return "Unknown"
+
+def get_category_name(youtube, category_id: str) -> str:
+    """카테고리 ID를 카테고리 이름으로 변환합니다."""
+    prime_category_cache(youtube)
+    return category_cache.get(category_id, "Unknown")
 
 # 데이터베이스 함수
+def get_db_connection() -> sqlite3.Connection:
+    """실행 전체에서 공유하는 데이터베이스 연결을 반환합니다. 첫 호출 시 연결을 열고 PRAGMA를 설정합니다."""
+    global DB_CONNECTION
+    if DB_CONNECTION is None:
+        # 트랜잭션은 save_videos에서 BEGIN으로 직접 관리합니다
+        DB_CONNECTION = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, timeout=30)
+        DB_CONNECTION.execute("PRAGMA journal_mode=WAL")
+        DB_CONNECTION.execute("PRAGMA synchronous=NORMAL")
+        DB_CONNECTION.execute("PRAGMA temp_store=MEMORY")
+        DB_CONNECTION.execute("PRAGMA cache_size=-20000")
+        DB_CONNECTION.execute("PRAGMA mmap_size=268435456")
+        # 종료 시 연결을 닫아 WAL 내용을 DB 파일에 반영합니다
+        atexit.register(close_db_connection)
+    return DB_CONNECTION
+
+def close_db_connection() -> None:
+    """공유 데이터베이스 연결의 통계를 갱신(PRAGMA optimize)한 뒤 닫습니다."""
+    global DB_CONNECTION
+    if DB_CONNECTION is None:
+        return
+    try:
+        DB_CONNECTION.execute("PRAGMA optimize")
+    except sqlite3.Error as e:
+        logging.warning(f"PRAGMA optimize 실행 중 오류 발생: {e}")
+    finally:
+        DB_CONNECTION.close()
+        DB_CONNECTION = None
+
 def init_db(reset: bool = False) -> None:
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_db_connection() as conn:
             c = conn.cursor()
             if reset:
                 c.execute("DROP TABLE IF EXISTS videos")
@@ -300,8 +396,11 @@ def init_db(reset: bool = False) -> None:
                 logging.error(f"데이터베이스 무결성 검사 실패: {integrity_result}")
                 raise sqlite3.IntegrityError("데이터베이스 무결성 검사 실패")
             
-            c.execute("SELECT COUNT(*) FROM videos")
-            count = c.fetchone()[0]
+            # 방금 테이블을 삭제했다면 비어 있는 것이 확실하므로 COUNT(*)를 건너뜁니다
+            count = 0
+            if not reset:
+                c.execute("SELECT COUNT(*) FROM videos")
+                count = c.fetchone()[0]
             
             if reset or count == 0:
                 logging.info("새로운 데이터베이스가 초기화되었습니다.")
@@ -322,29 +421,34 @@ def initialize_database_if_needed():
         logging.error(f"데이터베이스 초기화 중 오류 발생: {e}")
         raise
 
-def get_existing_video_ids() -> Set[str]:
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute("SELECT video_id FROM videos")
-        return set(row[0] for row in c.fetchall())
+def find_existing_video_ids(video_ids: List[str], chunk_size: int = 900) -> Set[str]:
+    """주어진 동영상 ID 중 이미 저장된 ID만 기본 키 인덱스로 조회합니다."""
+    video_ids = list(video_ids)
+    existing_ids = set()
+    c = get_db_connection().cursor()
+    # SQLite의 바인딩 변수 개수 제한 안에서 나눠서 조회
+    for i in range(0, len(video_ids), chunk_size):
+        chunk = video_ids[i:i+chunk_size]
+        placeholders = ','.join('?' * len(chunk))
+        c.execute(f"SELECT video_id FROM videos WHERE video_id IN ({placeholders})", chunk)
+        existing_ids.update(row[0] for row in c)
+    return existing_ids
 
 def save_video(video: Dict[str, Any]):
+    save_videos([video])
+
+def save_videos(videos: List[Dict[str, Any]]):
+    """동영상 정보를 하나의 트랜잭션으로 한 번에 저장합니다."""
+    if not videos:
+        return
+
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        conn = get_db_connection()
+        with conn:
             c = conn.cursor()
-            c.execute('''
-                INSERT OR REPLACE INTO videos 
-                (video_id, channel_id, channel_title, title, description, published_at, 
-                 thumbnail_url, category_id, category_name, duration, tags, 
-                 live_broadcast_content, scheduled_start_time, caption, 
-                 view_count, like_count, comment_count, source)
-                VALUES 
-                (:video_id, :channel_id, :channel_title, :title, :description, :published_at,
-                 :thumbnail_url, :category_id, :category_name, :duration, :tags,
-                 :live_broadcast_content, :scheduled_start_time, :caption,
-                 :view_count, :like_count, :comment_count, :source)
-            ''', video)
-        logging.info(f"동영상 정보 저장 완료: {video['video_id']}")
+            c.execute("BEGIN IMMEDIATE")  # 쓰기 잠금을 처음부터 잡아 중간 잠금 승격 실패를 피합니다
+            c.executemany(INSERT_VIDEO_SQL, videos)
+        logging.info(f"동영상 정보 {len(videos)}개 저장 완료")
     except sqlite3.Error as e:
         logging.error(f"데이터베이스 저장 중 오류 발생: {e}")
         raise DatabaseError("동영상 정보 저장 실패")
@@ -449,7 +553,6 @@ def fetch_playlist_videos(youtube, playlist_id: str) -> Tuple[List[Tuple[str, Di
     playlist_items = []
     next_page_token = None
     max_results = INIT_MAX_RESULTS if INITIALIZE_MODE_YOUTUBE else MAX_RESULTS
-    results_per_page = 50
     playlist_info = None
 
     try:
@@ -469,8 +572,9 @@ def fetch_playlist_videos(youtube, playlist_id: str) -> Tuple[List[Tuple[str, Di
             playlist_request = youtube.playlistItems().list(
                 part="snippet,contentDetails,status",
                 playlistId=playlist_id,
-                maxResults=results_per_page,
-                pageToken=next_page_token
+                maxResults=min(50, max_results - len(playlist_items)),
+                pageToken=next_page_token,
+                fields=PLAYLIST_ITEM_FIELDS
             )
             playlist_response = playlist_request.execute()
             
@@ -485,7 +589,8 @@ def fetch_playlist_videos(youtube, playlist_id: str) -> Tuple[List[Tuple[str, Di
 
         logging.info(f"재생목록에서 {len(playlist_items)}개의 동영상 항목을 가져왔습니다.")
 
-        playlist_items = sort_playlist_items(playlist_items[:max_results])
+        del playlist_items[max_results:]
+        playlist_items = sort_playlist_items(playlist_items)
         
         return playlist_items, playlist_info
 
@@ -493,24 +598,25 @@ def fetch_playlist_videos(youtube, playlist_id: str) -> Tuple[List[Tuple[str, Di
         logging.error(f"재생목록 정보를 가져오는 중 오류 발생: {e}")
         raise YouTubeAPIError("재생목록 동영상 정보 가져오기 실패")
 	    
-def sort_playlist_items(playlist_items: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
-    def get_published_at(item):
-        snippet = item[1].get('snippet', {})
-        return snippet.get('publishedAt') or snippet.get('publishTime') or ''
-
-    def get_position(item):
-        snippet = item[1].get('snippet', {})
-        return int(snippet.get('position', 0))
-
-    if YOUTUBE_PLAYLIST_SORT == 'position_reverse':
-        return sorted(playlist_items, key=get_position, reverse=True)
-    elif YOUTUBE_PLAYLIST_SORT == 'date_newest':
-        return sorted(playlist_items, key=get_published_at, reverse=True)
-    elif YOUTUBE_PLAYLIST_SORT == 'date_oldest':
-        return sorted(playlist_items, key=get_published_at)
-    else:  # 'position' (default)
-        return sorted(playlist_items, key=get_position)
+def get_playlist_item_published_at(item: Tuple[str, Dict[str, Any]]) -> str:
+    snippet = item[1].get('snippet', {})
+    return snippet.get('publishedAt') or snippet.get('publishTime') or ''
+
+def get_playlist_item_position(item: Tuple[str, Dict[str, Any]]) -> int:
+    snippet = item[1].get('snippet', {})
+    return int(snippet.get('position', 0))
+
+# 재생목록 정렬 방식별 (정렬 키, 역순 여부). 실행 중에는 바뀌지 않으므로 모듈 로드 시 한 번만 결정합니다
+PLAYLIST_SORT_OPTIONS = {
+    'position_reverse': (get_playlist_item_position, True),
+    'date_newest': (get_playlist_item_published_at, True),
+    'date_oldest': (get_playlist_item_published_at, False),
+    'position': (get_playlist_item_position, False),
+}
+PLAYLIST_SORT_KEY, PLAYLIST_SORT_REVERSE = PLAYLIST_SORT_OPTIONS.get(YOUTUBE_PLAYLIST_SORT, PLAYLIST_SORT_OPTIONS['position'])
 
+def sort_playlist_items(playlist_items: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+    playlist_items.sort(key=PLAYLIST_SORT_KEY, reverse=PLAYLIST_SORT_REVERSE)
     logging.info(f"재생목록 정렬 완료: '{YOUTUBE_PLAYLIST_SORT}' 모드, 총 {len(playlist_items)}개 항목")
     return playlist_items
 	
@@ -571,21 +677,24 @@ def fetch_search_videos(youtube, search_keyword: str) -> List[Tuple[str, Dict[st
     return video_items
 
 def sort_search_videos(videos):
+    """검색 결과를 제자리에서 정렬합니다 (호출한 쪽이 소유한 리스트이므로 복사본을 만들지 않음)."""
     if YOUTUBE_SEARCH_SORT == 'date_newest':
-        return sorted(videos, key=lambda x: x['published_at'], reverse=True)
+        videos.sort(key=itemgetter('published_at'), reverse=True)
     elif YOUTUBE_SEARCH_SORT == 'title_asc':
-        return sorted(videos, key=lambda x: x['title'])
+        videos.sort(key=itemgetter('title'))
     elif YOUTUBE_SEARCH_SORT == 'title_desc':
-        return sorted(videos, key=lambda x: x['title'], reverse=True)
+        videos.sort(key=itemgetter('title'), reverse=True)
     else:  # 'date_oldest' (default)
-        return sorted(videos, key=lambda x: x['published_at'])
+        videos.sort(key=itemgetter('published_at'))
+    return videos
 	    
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=5), retry=retry_if_exception_type(HttpError))
 def get_full_video_data(youtube, video_id: str, basic_info: Dict[str, Any]) -> Dict[str, Any]:
     try:
         video_response = youtube.videos().list(
             part="snippet,contentDetails,statistics,liveStreamingDetails",
-            id=video_id
+            id=video_id,
+            fields=VIDEO_DETAIL_FIELDS
         ).execute()
         
         if not video_response.get('items'):
@@ -634,7 +743,8 @@ def fetch_video_details(youtube, video_ids: List[str]) -> List[Dict[str, Any]]:
         try:
             video_details_response = youtube.videos().list(
                 part="snippet,contentDetails,statistics,liveStreamingDetails",
-                id=','.join(chunk)
+                id=','.join(chunk),
+                fields=VIDEO_DETAIL_FIELDS
             ).execute()
             video_details.extend(video_details_response.get('items', []))
         except Exception as e:
@@ -650,8 +760,13 @@ def process_new_videos(youtube, videos: List[Tuple[str, Dict[str, Any]]], video_
     logging.info(f"고급 필터 설정: {ADVANCED_FILTER_YOUTUBE}")
     logging.info(f"날짜 필터 설정: {DATE_FILTER_YOUTUBE}")
     logging.info(f"날짜 필터 해석 결과 - 시작일: {since_date}, 종료일: {until_date}, 과거 기준일: {past_date}")
+    date_bounds = get_date_bounds(since_date, until_date, past_date)
     
     for video_id, snippet in videos:
+        if video_id in existing_video_ids:
+            logging.info(f"이미 존재하는 동영상 건너뛰기: {video_id}")
+            continue
+
         if video_id not in video_details_dict:
             logging.warning(f"동영상 세부 정보를 찾을 수 없음: {video_id}")
             continue
@@ -663,12 +778,8 @@ def process_new_videos(youtube, videos: List[Tuple[str, Dict[str, Any]]], video_
         live_streaming_details = video_detail.get('liveStreamingDetails', {})
 
         published_at = snippet['publishedAt']
-        
-        if video_id in existing_video_ids:
-            logging.info(f"이미 존재하는 동영상 건너뛰기: {video_id}")
-            continue
 
-        if not is_within_date_range(published_at, since_date, until_date, past_date):
+        if not is_within_date_range(published_at, date_bounds):
             logging.info(f"날짜 필터에 의해 제외된 동영상: {snippet['title']}")
             filtered_by_date += 1
             continue
@@ -710,17 +821,39 @@ def process_new_videos(youtube, videos: List[Tuple[str, Dict[str, Any]]], video_
     
     return new_videos
 			       
+def fetch_channel_thumbnails(youtube, channel_ids: List[str]) -> None:
+    """여러 채널의 썸네일을 50개씩 묶어 조회하고 channel_thumbnail_cache에 저장합니다."""
+    channel_ids = [channel_id for channel_id in dict.fromkeys(channel_ids) if channel_id not in channel_thumbnail_cache]
+    chunk_size = 50
+    for i in range(0, len(channel_ids), chunk_size):
+        chunk = channel_ids[i:i+chunk_size]
+        try:
+            response = youtube.channels().list(
+                part="snippet",
+                id=','.join(chunk),
+                maxResults=chunk_size
+            ).execute()
+            for item in response.get('items', []):
+                channel_thumbnail_cache[item['id']] = item['snippet']['thumbnails']['default']['url']
+        except Exception as e:
+            logging.error(f"채널 썸네일을 가져오는 데 실패했습니다: {e}")
+
 def get_channel_thumbnail(youtube, channel_id: str) -> str:
     """채널 썸네일을 가져옵니다."""
+    if channel_id in channel_thumbnail_cache:
+        return channel_thumbnail_cache[channel_id]
+
     try:
         response = youtube.channels().list(
             part="snippet",
             id=channel_id
         ).execute()
-        return response['items'][0]['snippet']['thumbnails']['default']['url']
+        thumbnail_url = response['items'][0]['snippet']['thumbnails']['default']['url']
     except Exception as e:
         logging.error(f"채널 썸네일을 가져오는 데 실패했습니다: {e}")
-        return ""
+        thumbnail_url = ""
+    channel_thumbnail_cache[channel_id] = thumbnail_url
+    return thumbnail_url
 
 def fetch_playlist_info(youtube, playlist_id: str) -> Dict[str, str]:
     try:
@@ -741,25 +874,51 @@ def fetch_playlist_info(youtube, playlist_id: str) -> Dict[str, str]:
     return None
 
 # Discord 관련 함수
+def parse_discord_wait_seconds(value: Any, default: float = 1.0) -> float:
+    """Discord가 알려준 대기 시간 값을 초 단위 실수로 변환합니다. 값이 잘못되었으면 기본값을 사용합니다."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return default
+    # 음수, NaN, 무한대는 time.sleep에 넘길 수 없으므로 기본값으로 대체
+    return seconds if 0 <= seconds < float('inf') else default
+
+def get_discord_retry_after(response: requests.Response) -> float:
+    """Discord 429 응답에서 재시도까지 기다릴 시간(초)을 구합니다."""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        retry_after = body.get('retry_after') if isinstance(body, dict) else None
+    return parse_discord_wait_seconds(retry_after)
+
+def get_discord_reset_after(response: requests.Response) -> float:
+    """Discord 응답 헤더에서 속도 제한 버킷이 초기화될 때까지의 시간(초)을 구합니다."""
+    return parse_discord_wait_seconds(response.headers.get('X-RateLimit-Reset-After'))
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=5), retry=retry_if_exception_type(requests.RequestException))
-def send_to_discord(message: str, is_embed: bool = False, is_detail: bool = False) -> None:
+def send_to_discord(message: str, is_embed: bool = False, is_detail: bool = False, max_rate_limit_retries: int = 3) -> None:
     global discord_message_count, discord_message_reset_time
 
-    current_time = time.time()
-    if current_time - discord_message_reset_time >= 60:
-        discord_message_count = 0
-        discord_message_reset_time = current_time
-    
-    if discord_message_count >= 30:
-        wait_time = 60 - (current_time - discord_message_reset_time)
-        if wait_time > 0:
-            logging.info(f"Discord API 제한에 도달했습니다. {wait_time:.2f}초 대기 중...")
-            time.sleep(wait_time)
+    # 상세 보기 웹훅은 별도 스레드에서 전송될 수 있으므로 분당 전송 수 확인과 예약을 잠금 안에서 처리
+    with discord_message_lock:
+        current_time = time.time()
+        if current_time - discord_message_reset_time >= 60:
             discord_message_count = 0
-            discord_message_reset_time = time.time()
+            discord_message_reset_time = current_time
+
+        if discord_message_count >= 30:
+            wait_time = 60 - (current_time - discord_message_reset_time)
+            if wait_time > 0:
+                logging.info(f"Discord API 제한에 도달했습니다. {wait_time:.2f}초 대기 중...")
+                time.sleep(wait_time)
+                discord_message_count = 0
+                discord_message_reset_time = time.time()
+
+        discord_message_count += 1
 
-    headers = {'Content-Type': 'application/json'}
-    
     if is_embed:
         payload = message
     else:
@@ -772,15 +931,26 @@ def send_to_discord(message: str, is_embed: bool = False, is_detail: bool = Fals
     webhook_url = DISCORD_WEBHOOK_YOUTUBE_DETAILVIEW if is_detail and DISCORD_WEBHOOK_YOUTUBE_DETAILVIEW else DISCORD_WEBHOOK_YOUTUBE
     
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers)
-        response.raise_for_status()
+        for attempt in range(max_rate_limit_retries):
+            response = SESSION.post(webhook_url, json=payload, headers=DISCORD_HEADERS)
+            if response.status_code == 429 and attempt < max_rate_limit_retries - 1:
+                # 속도 제한에 걸린 경우 서버가 알려준 시간만큼만 대기 후 재시도
+                retry_after = get_discord_retry_after(response)
+                logging.warning(f"Discord 속도 제한 도달 (시도 {attempt + 1}/{max_rate_limit_retries}). {retry_after}초 후 재시도합니다.")
+                time.sleep(retry_after)
+                continue
+            response.raise_for_status()
+            break
         logging.info(f"Discord에 메시지 전송 완료 ({'상세' if is_detail else '기본'} 웹훅)")
-        discord_message_count += 1
     except requests.RequestException as e:
         logging.error(f"Discord에 메시지를 전송하는 데 실패했습니다: {e}")
         raise DiscordWebhookError("Discord 웹훅 호출 중 오류 발생")
-    
-    time.sleep(2)  # 추가적인 속도 제한을 위한 대기
+
+    # 고정 대기 대신, 남은 요청 수가 없을 때만 속도 제한 버킷이 초기화될 때까지 대기
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        reset_after = get_discord_reset_after(response)
+        logging.info(f"Discord 속도 제한 버킷 소진, {reset_after}초 대기합니다.")
+        time.sleep(reset_after)
 
 def create_discord_message(video: Dict[str, Any], formatted_published_at: str, video_url: str, playlist_info: Dict[str, str] = None) -> str:
     if LANGUAGE_YOUTUBE == 'Korean':
@@ -854,6 +1024,11 @@ def get_source_text_english(video: Dict[str, Any], playlist_info: Dict[str, str]
         logging.warning(f"Unknown YOUTUBE_MODE: {YOUTUBE_MODE}")
         return f"`{video['channel_title']} - YouTube Channel`\n"
 
+# 임베드 필드 이름 (언어별로 고정이므로 모듈 로드 시 한 번만 결정)
+EMBED_FIELD_NAMES_EN = ("🆔 Video ID", "📁 Category", "🏷️ Tags", "⌛ Duration", "🔡 Subtitle", "▶️ Play Video")
+EMBED_FIELD_NAMES_KO = ("🆔 영상 ID", "📁 영상 분류", "🏷️ 영상 태그", "⌛ 영상 길이", "🔡 영상 자막", "▶️ 영상 재생")
+EMBED_FIELD_NAMES = EMBED_FIELD_NAMES_EN if LANGUAGE_YOUTUBE == 'English' else EMBED_FIELD_NAMES_KO
+
 def create_embed_message(video: Dict[str, Any], youtube) -> Dict[str, Any]:
     """임베드 메시지를 생성합니다."""
 	
@@ -866,41 +1041,21 @@ def create_embed_message(video: Dict[str, Any], youtube) -> Dict[str, Any]:
     tags = video['tags'].split(',') if video['tags'] else []
     formatted_tags = ' '.join(f'`{tag.strip()}`' for tag in tags)
     
-    play_text = "Play Video" if LANGUAGE_YOUTUBE == 'English' else "영상 재생"
-    play_link = f"https://www.youtube.com/watch?v={video['video_id']}"
-    embed_link = f"https://www.youtube.com/embed/{video['video_id']}"
-    
+    field_values = (
+        f"`{video['video_id']}`",
+        video['category_name'],
+        formatted_tags if formatted_tags else "N/A",
+        video['duration'],
+        f"[Download](https://downsub.com/?url={video['video_url']})",
+        f"[Embed](https://www.youtube.com/embed/{video['video_id']})",
+    )
+
     embed = {
         "title": video['title'],
         "description": video['description'][:4096],  # Discord 제한
         "url": video['video_url'],
         "color": 16711680,  # Red color
-        "fields": [
-            {
-                "name": "🆔 Video ID" if LANGUAGE_YOUTUBE == 'English' else "🆔 영상 ID",
-                "value": f"`{video['video_id']}`"
-            },            
-            {
-                "name": "📁 Category" if LANGUAGE_YOUTUBE == 'English' else "📁 영상 분류",
-				"value": video['category_name']
-            },
-            {
-                "name": "🏷️ Tags" if LANGUAGE_YOUTUBE == 'English' else "🏷️ 영상 태그",
-                "value": formatted_tags if formatted_tags else "N/A"
-            },
-            {
-                "name": "⌛ Duration" if LANGUAGE_YOUTUBE == 'English' else "⌛ 영상 길이",
-                "value": video['duration']
-            },            
-            {
-                "name": "🔡 Subtitle" if LANGUAGE_YOUTUBE == 'English' else "🔡 영상 자막",
-                "value": f"[Download](https://downsub.com/?url={video['video_url']})"
-            },
-            {
-                "name": "▶️ " + play_text,
-                "value": f"[Embed]({embed_link})"
-            }
-        ],
+        "fields": [{"name": name, "value": value} for name, value in zip(EMBED_FIELD_NAMES, field_values)],
         "author": {
             "name": video['channel_title'],
             "url": f"https://www.youtube.com/channel/{video['channel_id']}",
@@ -930,11 +1085,12 @@ def fetch_video_data(youtube):
     return videos, info
 
 def process_videos(youtube, videos, info):
-    existing_video_ids = get_existing_video_ids()
     since_date, until_date, past_date = parse_date_filter(DATE_FILTER_YOUTUBE)
     
     video_ids = [video[0] for video in videos]
-    video_details = fetch_video_details(youtube, video_ids)
+    existing_video_ids = find_existing_video_ids(video_ids)
+    # 이미 저장된 동영상은 세부 정보가 필요 없으므로 새 동영상만 조회합니다
+    video_details = fetch_video_details(youtube, [video_id for video_id in video_ids if video_id not in existing_video_ids])
     video_details_dict = {video['id']: video for video in video_details}
     
     new_videos = process_new_videos(youtube, videos, video_details_dict, existing_video_ids, since_date, until_date, past_date)
@@ -943,23 +1099,90 @@ def process_videos(youtube, videos, info):
         new_videos = sort_search_videos(new_videos)
     
     logging.info(f"처리할 새로운 동영상 수: {len(new_videos)}")
+
+    if YOUTUBE_DETAILVIEW:
+        # 상세 보기 임베드에 쓰는 채널 썸네일을 미리 한 번에 조회
+        fetch_channel_thumbnails(youtube, [video['channel_id'] for video in new_videos])
     
-    for video in new_videos:
-        save_video(video)
-        send_discord_messages(video, youtube, info)
+    # 상세 보기 웹훅이 기본 웹훅과 다르면 채널별 순서를 지키면서 두 웹훅에 동시에 전송합니다
+    # (상세 전송은 작업자 하나가 제출 순서대로 처리)
+    use_detail_worker = YOUTUBE_DETAILVIEW and DISCORD_WEBHOOK_YOUTUBE_DETAILVIEW and DISCORD_WEBHOOK_YOUTUBE_DETAILVIEW != DISCORD_WEBHOOK_YOUTUBE
+    detail_executor = ThreadPoolExecutor(max_workers=1) if use_detail_worker else None
+    detail_futures = []
+    failed_details = []  # 상세 보기 전송에 실패한 (동영상, 임베드 메시지) 목록. 게시가 끝난 뒤 한 번 더 전송합니다
+
+    # 기본 메시지가 게시된 동영상만 모아 두었다가, 중간에 오류가 나더라도 마지막에 한 번에 기록합니다
+    pending_videos = []
+    try:
+        for video in new_videos:
+            try:
+                send_basic_message(video, info)
+            except DiscordWebhookError as e:
+                # 한 동영상의 전송 실패로 나머지 동영상까지 중단하지 않고, 저장하지 않아 다음 실행에서 다시 전송합니다
+                logging.warning(f"동영상 전송 실패, 다음 동영상으로 넘어갑니다: {video['video_id']} ({e})")
+                continue
+
+            # 기본 메시지가 이미 게시되었으므로 상세 보기 전송 결과와 관계없이 저장합니다 (기본 메시지 중복 게시 방지)
+            pending_videos.append(video)
+            if not YOUTUBE_DETAILVIEW:
+                continue
+            # 임베드 생성(YouTube API 호출 가능)은 메인 스레드에서, 전송만 작업자 스레드에서 수행
+            detailed_message = create_embed_message(video, youtube)
+            try:
+                detail_future = send_detail_message(detailed_message, detail_executor)
+            except DiscordWebhookError as e:
+                logging.warning(f"상세 보기 메시지 전송 실패: {video['video_id']} ({e})")
+                failed_details.append((video, detailed_message))
+                continue
+            if detail_future:
+                detail_futures.append((video, detailed_message, detail_future))
+
+        if detail_executor:
+            detail_executor.shutdown(wait=True)
+        for video, detailed_message, detail_future in detail_futures:
+            error = detail_future.exception()
+            if error:
+                logging.warning(f"상세 보기 메시지 전송 실패: {video['video_id']} ({error})")
+                failed_details.append((video, detailed_message))
+        retry_detail_messages(failed_details)
+    finally:
+        if detail_executor:
+            detail_executor.shutdown(wait=True)
+        save_videos(pending_videos)
     
     return new_videos, len(videos) - len(new_videos)
 	
-def send_discord_messages(video, youtube, info):
+def send_basic_message(video, info):
+    """기본 웹훅으로 동영상 알림 메시지를 전송합니다."""
     logging.info(f"처리 중인 동영상: {video['title']}")
     
     formatted_published_at = convert_to_local_time(video['published_at'])
     basic_message = create_discord_message(video, formatted_published_at, video['video_url'], info)
     send_to_discord(basic_message, is_embed=False, is_detail=False)
-    
-    if YOUTUBE_DETAILVIEW:
-        detailed_message = create_embed_message(video, youtube)
-        send_to_discord(detailed_message, is_embed=True, is_detail=True)
+
+def send_detail_message(detailed_message, detail_executor=None):
+    """상세 보기 임베드를 전송합니다. detail_executor가 있으면 그쪽에 맡기고 Future를 반환합니다."""
+    if detail_executor:
+        return detail_executor.submit(send_to_discord, detailed_message, is_embed=True, is_detail=True)
+    send_to_discord(detailed_message, is_embed=True, is_detail=True)
+    return None
+
+def retry_detail_messages(failed_details):
+    """전송에 실패한 상세 보기 임베드를 제출 순서대로 한 번 더 전송합니다 (동영상은 이미 저장 대상이므로 다음 실행에서는 재시도하지 않음)."""
+    if not failed_details:
+        return
+
+    logging.info(f"전송에 실패한 상세 보기 메시지 {len(failed_details)}개를 다시 전송합니다.")
+    still_failed = []
+    for video, detailed_message in failed_details:
+        try:
+            send_to_discord(detailed_message, is_embed=True, is_detail=True)
+        except DiscordWebhookError as e:
+            logging.warning(f"상세 보기 메시지 재전송 실패: {video['video_id']} ({e})")
+            still_failed.append(video['video_id'])
+
+    if still_failed:
+        logging.error(f"상세 보기 메시지를 끝내 전송하지 못한 동영상: {', '.join(still_failed)}")
 
 def print_env_vars():
     logging.info("환경 변수 설정:")